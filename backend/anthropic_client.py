@@ -0,0 +1,52 @@
+import os
+import functools
+import importlib.util
+from pathlib import Path
+from anthropic import Anthropic, AsyncAnthropic, DefaultHttpxClient, DefaultAsyncHttpxClient
+from dotenv import load_dotenv
+import httpx
+
+# Load .env file from the backend directory (works in both local and Docker)
+env_path = Path(__file__).parent / '.env'
+
+# Connection pool shared by every Claude call in the process (summaries and fact-checking)
+MAX_CONNECTIONS = int(os.getenv("ANTHROPIC_MAX_CONNECTIONS", "20"))
+_limits = httpx.Limits(max_connections=MAX_CONNECTIONS, max_keepalive_connections=MAX_CONNECTIONS)
+
+# HTTP/2 lets concurrent requests multiplex over one connection; it needs the h2 package
+HTTP2 = importlib.util.find_spec("h2") is not None
+
+
+def _api_key() -> str:
+    """Read the API key, loading .env on first use rather than at import."""
+    load_dotenv(dotenv_path=env_path)
+    key = os.getenv("ANTHROPIC_API_KEY")
+    if not key:
+        raise ValueError("ANTHROPIC_API_KEY environment variable is required")
+    return key
+
+
+# One client of each flavour, created on first use and then reused so TLS
+# connections are kept alive between calls
+@functools.lru_cache(maxsize=1)
+def get_sync_client() -> Anthropic:
+    return Anthropic(
+        api_key=_api_key(),
+        http_client=DefaultHttpxClient(http2=HTTP2, limits=_limits)
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def get_async_client() -> AsyncAnthropic:
+    return AsyncAnthropic(
+        api_key=_api_key(),
+        http_client=DefaultAsyncHttpxClient(http2=HTTP2, limits=_limits)
+    )
+
+
+async def aclose():
+    """Close whichever clients were created. Called on application shutdown."""
+    if get_sync_client.cache_info().currsize:
+        get_sync_client().close()
+    if get_async_client.cache_info().currsize:
+        await get_async_client().close()
@@ -1,95 +1,443 @@
 import os
 import json
-from pathlib import Path
-from typing import List, Dict
-from anthropic import Anthropic
+import asyncio
+import functools
+from typing import Any, AsyncIterator, List, Dict, Optional, Tuple
+import orjson
+import anthropic_client
+from llm_cache import response_cache
 
-# Load .env file from the backend directory (works in both local and Docker)
-env_path = Path(__file__).parent / '.env'
+# Which API serves Claude: "anthropic" (default) or "bedrock" (AWS Bedrock with
+# latency-optimized inference, for user-facing synthesis calls)
+CLAUDE_BACKEND = os.getenv("CLAUDE_BACKEND", "anthropic").lower()
+BEDROCK_MODEL_ID = os.getenv("BEDROCK_MODEL_ID", "us.anthropic.claude-sonnet-4-20250514-v1:0")
 
-# Initialize Claude client
-ANTHROPIC_API_KEY = os.getenv("ANTHROPIC_API_KEY")
-if not ANTHROPIC_API_KEY:
-    raise ValueError("ANTHROPIC_API_KEY environment variable is required")
-
-client = Anthropic(api_key=ANTHROPIC_API_KEY)
+# Claude client, created (and the API key checked) on first call rather than at import
+_get_client = anthropic_client.get_async_client
 MODEL = "claude-sonnet-4-20250514"
+ACTIVE_MODEL = BEDROCK_MODEL_ID if CLAUDE_BACKEND == "bedrock" else MODEL
+
+# Sampling temperature; leave unset to use the API default. Responses are only
+# cached when sampling is deterministic (unset or 0).
+_temperature = os.getenv("CLAUDE_TEMPERATURE")
+TEMPERATURE: Optional[float] = float(_temperature) if _temperature else None
+CACHE_ENABLED = not TEMPERATURE
+
+# Static instructions for the analysis prompt. Sent as its own content block marked
+# for Anthropic prompt caching, ahead of the per-debate text.
+SUMMARY_PROMPT_PREFIX = """You are analyzing a debate. The debate question and its PRO and CON arguments (each with an ID) follow these instructions.
+
+Generate four things (do NOT create new arguments, only synthesize existing):
+1. OVERALL SUMMARY (2-3 paragraphs): What is this debate about? Main themes?
+2. CONSENSUS VIEW (1-2 paragraphs): What do both sides agree on?
+3. TIMELINE VIEW: Chronological narrative based on arguments. Array of {"period": "...", "description": "..."}
+4. PAIRS: For each PRO argument, find the CON argument (if any) that most directly rebuts it. Array of {"pro_id": <PRO ID>, "con_id": <CON ID>, "reason": "<one sentence>"}. Only use IDs listed in the debate; omit arguments with no direct counterpart.
+
+Return the result by calling the emit_summary tool."""
+
+# Structured output: Claude is forced to call this tool, so its input arrives as parsed JSON
+SUMMARY_TOOL = {
+    "name": "emit_summary",
+    "description": "Record the debate analysis and the PRO/CON rebuttal pairs.",
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "overall_summary": {"type": "string"},
+            "consensus_view": {"type": "string"},
+            "timeline_view": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "period": {"type": "string"},
+                        "description": {"type": "string"}
+                    },
+                    "required": ["period", "description"]
+                }
+            },
+            "pairs": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "pro_id": {"type": "integer"},
+                        "con_id": {"type": "integer"},
+                        "reason": {"type": "string"}
+                    },
+                    "required": ["pro_id", "con_id", "reason"]
+                }
+            }
+        },
+        "required": ["overall_summary", "consensus_view", "timeline_view", "pairs"]
+    }
+}
+SUMMARY_TOOL_CHOICE = {"type": "tool", "name": SUMMARY_TOOL["name"]}
+
 
-def generate_summary(question: str, pro_arguments: List[Dict], con_arguments: List[Dict]) -> Dict:
+def _message_content(prompt: str) -> List[Dict]:
+    """User message content: the cacheable instruction prefix followed by the debate text."""
+    return [
+        {"type": "text", "text": SUMMARY_PROMPT_PREFIX, "cache_control": {"type": "ephemeral"}},
+        {"type": "text", "text": prompt}
+    ]
+
+
+def _summary_from_content(content: List[Any]) -> Dict:
     """
-    Generate overall summary, consensus view, and timeline view using Claude.
-    
-    Args:
-        question: The debate question
-        pro_arguments: List of pro arguments with 'title' and 'content'
-        con_arguments: List of con arguments with 'title' and 'content'
+    Pull the emit_summary input out of a response's content blocks.
     
-    Returns:
-        Dictionary with 'overall_summary', 'consensus_view', and 'timeline_view'
+    Accepts SDK block objects or Bedrock's plain dicts. Falls back to parsing JSON
+    out of a text block in the unlikely case the model answered without the tool.
     """
-    # Format pro arguments
-    pro_text = "\n\n".join([
-        f"Title: {arg['title']}\nContent: {arg['content']}"
-        for arg in pro_arguments
-    ]) if pro_arguments else "None"
+    def field(block, name):
+        return block.get(name) if isinstance(block, dict) else getattr(block, name, None)
     
-    # Format con arguments
-    con_text = "\n\n".join([
-        f"Title: {arg['title']}\nContent: {arg['content']}"
-        for arg in con_arguments
-    ]) if con_arguments else "None"
+    for block in content:
+        if field(block, 'type') == 'tool_use':
+            return dict(field(block, 'input'))
+    for block in content:
+        if field(block, 'type') == 'text':
+            return orjson.loads(_extract_json(field(block, 'text')))
+    raise ValueError("Claude response contained no summary")
+
+
+@functools.lru_cache(maxsize=1)
+def _get_bedrock_client():
+    """Create the Bedrock runtime client on first use (boto3 is only needed for this backend)."""
+    import boto3
+    return boto3.client("bedrock-runtime")
+
+
+def _invoke_bedrock(prompt: str, max_tokens: int) -> Dict:
+    """Invoke Claude on Bedrock with latency-optimized inference."""
+    body = {
+        "anthropic_version": "bedrock-2023-05-31",
+        "max_tokens": max_tokens,
+        "tools": [SUMMARY_TOOL],
+        "tool_choice": SUMMARY_TOOL_CHOICE,
+        "messages": [
+            {
+                "role": "user",
+                "content": f"{SUMMARY_PROMPT_PREFIX}\n\n{prompt}"
+            }
+        ]
+    }
+    if TEMPERATURE is not None:
+        body["temperature"] = TEMPERATURE
+    response = _get_bedrock_client().invoke_model(
+        modelId=BEDROCK_MODEL_ID,
+        body=orjson.dumps(body),
+        contentType="application/json",
+        accept="application/json",
+        performanceConfigLatency="optimized"
+    )
+    payload = orjson.loads(response["body"].read())
+    return _summary_from_content(payload["content"])
+
+
+async def _invoke_claude(prompt: str, max_tokens: int) -> Dict:
+    """Send the analysis prompt to Claude on the configured backend and return the tool input."""
+    if CLAUDE_BACKEND == "bedrock":
+        return await asyncio.to_thread(_invoke_bedrock, prompt, max_tokens)
     
-    prompt = f"""You are analyzing a debate on: {question}
+    extra_params = {"temperature": TEMPERATURE} if TEMPERATURE is not None else {}
+    message = await _get_client().messages.create(
+        model=MODEL,
+        max_tokens=max_tokens,
+        tools=[SUMMARY_TOOL],
+        tool_choice=SUMMARY_TOOL_CHOICE,
+        messages=[
+            {
+                "role": "user",
+                "content": _message_content(prompt)
+            }
+        ],
+        **extra_params
+    )
+    return _summary_from_content(message.content)
+
+
+# Per-debate part of the analysis prompt, filled with format_map
+SUMMARY_PROMPT_TEMPLATE = """Debate question: {question}
 
 PRO arguments:
 {pro_text}
 
 CON arguments:
-{con_text}
+{con_text}"""
+_format_argument = "ID: {id} | Title: {title} | Content: {content}".format_map
+_ARGUMENT_KEYS = frozenset(('id', 'title', 'content'))
 
-Generate three things (do NOT create new arguments, only synthesize existing):
-1. OVERALL SUMMARY (2-3 paragraphs): What is this debate about? Main themes?
-2. CONSENSUS VIEW (1-2 paragraphs): What do both sides agree on?
-3. TIMELINE VIEW: Chronological narrative based on arguments. Array of {{"period": "...", "description": "..."}}
 
-Return JSON only: {{"overall_summary": "...", "consensus_view": "...", "timeline_view": [...]}}"""
+def _format_arguments(arguments: List[Dict]) -> str:
+    """Render arguments as one string, joined directly from a generator."""
+    if not arguments:
+        return "None"
+    for argument in arguments:
+        if not _ARGUMENT_KEYS <= argument.keys():
+            raise KeyError(f"Argument is missing required keys: {sorted(_ARGUMENT_KEYS - argument.keys())}")
+    return "\n\n".join(_format_argument(argument) for argument in arguments)
+
+
+def _summary_max_tokens(pro_arguments: List[Dict], con_arguments: List[Dict]) -> int:
+    """
+    Estimate an output ceiling for the analysis call from the debate size.
+
+    The summary sections grow with the number of arguments (floor 1024, cap 4096);
+    each pair is ~60 tokens and there can be at most len(pro) * len(con) of them (cap 2048).
+    """
+    summary_budget = min(4096, max(1024, 200 * (len(pro_arguments) + len(con_arguments))))
+    pairs_budget = min(2048, 60 * max(1, len(pro_arguments)) * max(1, len(con_arguments)) + 256)
+    return summary_budget + pairs_budget
 
+
+def _build_summary_prompt(question: str, pro_arguments: List[Dict], con_arguments: List[Dict]) -> str:
+    """Build the per-debate part of the analysis prompt (follows SUMMARY_PROMPT_PREFIX)."""
+    return SUMMARY_PROMPT_TEMPLATE.format_map({
+        "question": question,
+        "pro_text": _format_arguments(pro_arguments),
+        "con_text": _format_arguments(con_arguments)
+    })
+
+
+def _extract_json(text: str) -> str:
+    """
+    Return the first balanced JSON object or array in text.
+    
+    Walks forward from the first '{' or '[' tracking nesting depth while skipping
+    string literals (and their escapes), so code fences or braces inside the
+    summary text don't confuse it. Returns the remainder of the text when the
+    structure never closes, letting the JSON parser report the error.
+    """
+    starts = [i for i in (text.find('{'), text.find('[')) if i != -1]
+    if not starts:
+        return text
+    start = min(starts)
+    depth = 0
+    in_string = False
+    escaped = False
+    for i in range(start, len(text)):
+        ch = text[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == '\\':
+                escaped = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch in '{[':
+            depth += 1
+        elif ch in '}]':
+            depth -= 1
+            if depth == 0:
+                return text[start:i + 1]
+    return text[start:]
+
+
+def _validate_summary_result(result: Dict, pro_arguments: List[Dict], con_arguments: List[Dict]) -> Dict:
+    """Validate Claude's structured reply to the summary prompt."""
+    # Validate structure
+    if not all(key in result for key in ['overall_summary', 'consensus_view', 'timeline_view']):
+        raise ValueError("Missing required fields in Claude response")
+    
+    if not isinstance(result['timeline_view'], list):
+        raise ValueError("timeline_view must be a list")
+    
+    # Pairs are best-effort: drop anything that doesn't reference a known argument
+    pro_ids = {a.get('id') for a in pro_arguments}
+    con_ids = {a.get('id') for a in con_arguments}
+    pairs = result.get('pairs') if isinstance(result.get('pairs'), list) else []
+    result['pairs'] = [
+        {'pro_id': p['pro_id'], 'con_id': p['con_id'], 'reason': p.get('reason')}
+        for p in pairs
+        if isinstance(p, dict) and p.get('pro_id') in pro_ids and p.get('con_id') in con_ids
+    ]
+    return result
+
+
+def _empty_analysis() -> Dict:
+    """Deterministic result for a debate with no arguments; no Claude call needed."""
+    return {"overall_summary": "", "consensus_view": "", "timeline_view": [], "pairs": []}
+
+
+async def generate_summary_and_pairs(question: str, pro_arguments: List[Dict], con_arguments: List[Dict]) -> Dict:
+    """
+    Generate the topic analysis and the pro/con argument pairs in a single Claude call.
+    
+    Args:
+        question: The debate question
+        pro_arguments: List of pro arguments with 'id', 'title' and 'content'
+        con_arguments: List of con arguments with 'id', 'title' and 'content'
+    
+    Returns:
+        Dictionary with 'overall_summary', 'consensus_view', 'timeline_view' and 'pairs'
+    """
+    if not pro_arguments and not con_arguments:
+        return _empty_analysis()
+    
+    prompt = _build_summary_prompt(question, pro_arguments, con_arguments)
+    
+    cache_key = response_cache.make_key(ACTIVE_MODEL, SUMMARY_PROMPT_PREFIX + prompt)
+    if CACHE_ENABLED:
+        cached = response_cache.get(cache_key)
+        if cached is not None:
+            return orjson.loads(cached)
+    
     try:
-        message = client.messages.create(
-            model=MODEL,
-            max_tokens=4096,
-            messages=[
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ]
-        )
-        
-        # Extract text from response
-        response_text = message.content[0].text.strip()
+        result = await _invoke_claude(prompt, max_tokens=_summary_max_tokens(pro_arguments, con_arguments))
+        result = _validate_summary_result(result, pro_arguments, con_arguments)
         
-        # Try to parse JSON from the response
-        # Claude might wrap JSON in markdown code blocks
-        if "```json" in response_text:
-            response_text = response_text.split("```json")[1].split("```")[0].strip()
-        elif "```" in response_text:
-            response_text = response_text.split("```")[1].split("```")[0].strip()
-        
-        result = json.loads(response_text)
-        
-        # Validate structure
-        if not all(key in result for key in ['overall_summary', 'consensus_view', 'timeline_view']):
-            raise ValueError("Missing required fields in Claude response")
-        
-        if not isinstance(result['timeline_view'], list):
-            raise ValueError("timeline_view must be a list")
+        if CACHE_ENABLED:
+            response_cache.set(cache_key, orjson.dumps(result).decode())
         
         return result
         
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         raise ValueError(f"Failed to parse JSON from Claude response: {e}")
     except Exception as e:
         raise RuntimeError(f"Claude API error: {e}")
 
 
+class _IncrementalJSONFields:
+    """
+    Optimistic parser for a streamed top-level JSON object (the summary tool input).
+    
+    Text is fed in as it arrives; complete top-level fields are reported as soon
+    as their value closes. Array values are reported element by element.
+    """
+    
+    def __init__(self):
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = None  # index just after the last consumed token
+        self._array_key = None  # key of the array currently being consumed
+    
+    def _skip(self, chars: str) -> None:
+        while self._pos < len(self._buffer) and self._buffer[self._pos] in chars:
+            self._pos += 1
+    
+    def _may_continue(self, value: Any, end: int) -> bool:
+        """A number ending exactly at the end of the buffer may still have digits to come."""
+        return end >= len(self._buffer) and isinstance(value, (int, float)) and not isinstance(value, bool)
+    
+    def feed(self, text: str) -> List[Tuple[str, Any]]:
+        """Add streamed text and return the (key, value) events completed by it."""
+        self._buffer += text
+        events = []
+        if self._pos is None:
+            start = self._buffer.find('{')
+            if start == -1:
+                return events
+            self._pos = start + 1
+        
+        while True:
+            if self._array_key is not None:
+                self._skip(' \t\r\n,')
+                if self._pos >= len(self._buffer):
+                    return events
+                if self._buffer[self._pos] == ']':
+                    self._pos += 1
+                    self._array_key = None
+                    continue
+                try:
+                    item, end = self._decoder.raw_decode(self._buffer, self._pos)
+                except json.JSONDecodeError:
+                    return events
+                if self._may_continue(item, end):
+                    return events
+                self._pos = end
+                events.append((self._array_key, item))
+                continue
+            
+            self._skip(' \t\r\n,')
+            if self._pos >= len(self._buffer) or self._buffer[self._pos] == '}':
+                return events
+            try:
+                key, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                return events
+            colon = self._buffer.find(':', end)
+            if colon == -1:
+                return events
+            value_start = colon + 1
+            while value_start < len(self._buffer) and self._buffer[value_start] in ' \t\r\n':
+                value_start += 1
+            if value_start >= len(self._buffer):
+                return events
+            if self._buffer[value_start] == '[':
+                self._pos = value_start + 1
+                self._array_key = key
+                continue
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, value_start)
+            except json.JSONDecodeError:
+                return events
+            if self._may_continue(value, end):
+                return events
+            self._pos = end
+            events.append((key, value))
+
+
+async def stream_summary_and_pairs(
+    question: str, pro_arguments: List[Dict], con_arguments: List[Dict]
+) -> AsyncIterator[Tuple[str, Any]]:
+    """
+    Stream the fused analysis as Claude generates it.
+    
+    Yields ('overall_summary', str) and ('consensus_view', str) as soon as each field
+    closes, ('timeline_view', item) and ('pairs', item) per array element, and finally
+    ('result', dict) with the validated result of generate_summary_and_pairs.
+    Cache hits and the Bedrock backend yield the final result only.
+    """
+    if not pro_arguments and not con_arguments:
+        yield 'result', _empty_analysis()
+        return
+    
+    prompt = _build_summary_prompt(question, pro_arguments, con_arguments)
+    max_tokens = _summary_max_tokens(pro_arguments, con_arguments)
+    
+    cache_key = response_cache.make_key(ACTIVE_MODEL, SUMMARY_PROMPT_PREFIX + prompt)
+    if CACHE_ENABLED:
+        cached = response_cache.get(cache_key)
+        if cached is not None:
+            yield 'result', orjson.loads(cached)
+            return
+    
+    try:
+        if CLAUDE_BACKEND == "bedrock":
+            result = await asyncio.to_thread(_invoke_bedrock, prompt, max_tokens)
+        else:
+            # The tool input arrives as partial JSON deltas
+            parser = _IncrementalJSONFields()
+            extra_params = {"temperature": TEMPERATURE} if TEMPERATURE is not None else {}
+            async with _get_client().messages.stream(
+                model=MODEL,
+                max_tokens=max_tokens,
+                tools=[SUMMARY_TOOL],
+                tool_choice=SUMMARY_TOOL_CHOICE,
+                messages=[
+                    {
+                        "role": "user",
+                        "content": _message_content(prompt)
+                    }
+                ],
+                **extra_params
+            ) as stream:
+                async for stream_event in stream:
+                    if stream_event.type == "input_json":
+                        for event in parser.feed(stream_event.partial_json):
+                            yield event
+                message = await stream.get_final_message()
+            result = _summary_from_content(message.content)
+        
+        result = _validate_summary_result(result, pro_arguments, con_arguments)
+    except orjson.JSONDecodeError as e:
+        raise ValueError(f"Failed to parse JSON from Claude response: {e}")
+    except Exception as e:
+        raise RuntimeError(f"Claude API error: {e}")
+    
+    if CACHE_ENABLED:
+        response_cache.set(cache_key, orjson.dumps(result).decode())
+    yield 'result', result
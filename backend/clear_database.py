@@ -0,0 +1,23 @@
+"""
+Remove all debates, arguments and matches and reset the ID sequences.
+
+Usage:
+    python clear_database.py
+"""
+import database
+
+
+def clear_database():
+    """Truncate all tables and restart their identity sequences in one statement."""
+    try:
+        with database.db_cursor() as (conn, cursor):
+            cursor.execute("TRUNCATE TABLE topics, arguments, argument_matches RESTART IDENTITY CASCADE")
+        print("Cleared topics, arguments and argument_matches; ID sequences reset.")
+    except Exception as e:
+        print(f"Error clearing database: {e}")
+        raise
+
+
+if __name__ == "__main__":
+    database.ensure_schema()
+    clear_database()
@@ -0,0 +1,193 @@
+"""
+Create sample debates with varied argument quality.
+
+All arguments are inserted first and then fact-checked together through the
+Anthropic Message Batches API, so the script makes two batch submissions in
+total instead of one pipeline run per argument. Pass --no-batch to get results
+immediately instead: the pipelines then run concurrently against the regular API.
+
+Usage:
+    python create_sample_debates.py [--no-batch]
+"""
+import argparse
+import asyncio
+
+import database
+import fact_checker
+
+# Maximum number of fact-checking pipelines in flight in --no-batch mode
+MAX_CONCURRENT_CHECKS = 5
+
+SAMPLE_DEBATES = [
+    {
+        "question": "Should cities ban gas-powered leaf blowers?",
+        "created_by": "sample_admin",
+        "pro": [
+            {
+                "title": "Two-stroke engines are heavy polluters",
+                "content": "The California Air Resources Board estimated that operating a commercial leaf blower for one hour emits smog-forming pollution comparable to driving a light-duty passenger car roughly 1,100 miles.",
+                "sources": "https://ww2.arb.ca.gov/our-work/programs/small-off-road-engines-sore",
+                "author": "clean_air_advocate",
+            },
+            {
+                "title": "Noise harms workers and residents",
+                "content": "Gas leaf blowers commonly exceed 90 decibels at the operator's ear, above the level where the CDC says prolonged exposure can cause hearing damage.",
+                "sources": "https://www.cdc.gov/hearing-loss/",
+                "author": "quiet_streets",
+            },
+            {
+                "title": "Electric alternatives already work",
+                "content": "Battery-powered blowers are now sold by every major landscaping brand, and several cities including Washington, D.C. have already phased out gas blowers.",
+                "sources": None,
+                "author": "green_gardener",
+            },
+        ],
+        "con": [
+            {
+                "title": "Cost burden on small landscapers",
+                "content": "Commercial battery blowers and the spare batteries needed for a full workday can cost several thousand dollars per crew, a significant expense for small businesses.",
+                "sources": None,
+                "author": "small_biz_owner",
+            },
+            {
+                "title": "Battery runtime is too short",
+                "content": "Many battery blowers run for well under an hour at full power, which forces crews to carry multiple batteries or slow down their work.",
+                "sources": None,
+                "author": "pro_landscaper",
+            },
+            {
+                "title": "This is government overreach",
+                "content": "People should be able to use whatever tools they want on their own property. Stop telling us how to live.",
+                "sources": None,
+                "author": "liberty_first",
+            },
+        ],
+    },
+    {
+        "question": "Should schools adopt a four-day week?",
+        "created_by": "sample_admin",
+        "pro": [
+            {
+                "title": "Helps with teacher recruitment",
+                "content": "Districts in states such as Colorado and Missouri have cited teacher recruitment and retention as a main reason for moving to a four-day schedule.",
+                "sources": None,
+                "author": "teacher_voice",
+            },
+            {
+                "title": "Reduces operating costs",
+                "content": "Closing buildings one extra day per week lowers transportation, utility and support-staff costs, although studies have found savings are usually modest.",
+                "sources": None,
+                "author": "budget_watch",
+            },
+            {
+                "title": "Kids are happier",
+                "content": "Everyone knows kids love three-day weekends. It's obvious this is better.",
+                "sources": None,
+                "author": "weekend_fan",
+            },
+        ],
+        "con": [
+            {
+                "title": "Achievement can decline",
+                "content": "Research by RAND and others on four-day school weeks found small negative effects on student achievement in some districts, particularly where total instructional time was reduced.",
+                "sources": "https://www.rand.org/",
+                "author": "ed_researcher",
+            },
+            {
+                "title": "Childcare burden on working parents",
+                "content": "A fifth weekday without school shifts childcare costs onto families, which disproportionately affects low-income and single-parent households.",
+                "sources": None,
+                "author": "working_parent",
+            },
+        ],
+    },
+    {
+        "question": "Is nuclear power necessary to reach net-zero emissions?",
+        "created_by": "sample_admin",
+        "pro": [
+            {
+                "title": "Nuclear is low-carbon and always on",
+                "content": "Lifecycle greenhouse gas emissions from nuclear power are comparable to wind, according to the IPCC, and reactors provide firm output regardless of weather.",
+                "sources": "https://www.ipcc.ch/report/ar5/wg3/",
+                "author": "grid_engineer",
+            },
+            {
+                "title": "France decarbonized its grid with nuclear",
+                "content": "France generates roughly 70% of its electricity from nuclear power and has one of the lowest-carbon electricity grids among large economies.",
+                "sources": None,
+                "author": "energy_historian",
+            },
+        ],
+        "con": [
+            {
+                "title": "New reactors are slow and expensive",
+                "content": "Recent Western projects such as Vogtle in Georgia and Hinkley Point C in the UK have run years behind schedule and billions of dollars over budget.",
+                "sources": None,
+                "author": "cost_realist",
+            },
+            {
+                "title": "Renewables plus storage are cheaper",
+                "content": "Lazard's levelized cost of energy analysis shows utility-scale solar and onshore wind are far cheaper per megawatt-hour than new nuclear.",
+                "sources": "https://www.lazard.com/research-insights/levelized-cost-of-energyplus/",
+                "author": "solar_sam",
+            },
+        ],
+    },
+]
+
+
+def create_sample_debates(use_batch: bool = True):
+    """Create the sample topics and arguments, then fact-check every argument together."""
+    database.ensure_schema()
+
+    topic_ids = database.bulk_create_topics(SAMPLE_DEBATES)
+
+    rows = []
+    questions = []
+    for topic_id, debate in zip(topic_ids, SAMPLE_DEBATES):
+        print(f"Created topic {topic_id}: {debate['question']}")
+
+        for side in ("pro", "con"):
+            for argument in debate[side]:
+                rows.append({"topic_id": topic_id, "side": side, **argument})
+                questions.append(debate["question"])
+
+    # Insert every argument with a single COPY
+    argument_ids = database.bulk_create_arguments(rows)
+    pending = [
+        {
+            "id": argument_id,
+            "title": row["title"],
+            "content": row["content"],
+            "debate_question": question,
+        }
+        for argument_id, row, question in zip(argument_ids, rows, questions)
+    ]
+
+    if use_batch:
+        print(f"Fact-checking {len(pending)} arguments via the Message Batches API...")
+        verdicts = fact_checker.verify_arguments_batch(pending)
+    else:
+        print(f"Fact-checking {len(pending)} arguments concurrently...")
+        verdicts = asyncio.run(fact_checker.verify_arguments_async(pending, MAX_CONCURRENT_CHECKS))
+
+    # Write every verdict back in one COPY + UPDATE instead of one UPDATE per argument
+    database.bulk_update_argument_validity([
+        (argument_id, verdict.validity_score, verdict.reasoning, verdict.key_urls)
+        for argument_id, verdict in verdicts.items()
+    ])
+    for argument_id, verdict in verdicts.items():
+        print(f"  Argument {argument_id}: {verdict.validity_score} stars")
+
+    print("Sample debates created.")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Create sample debates.")
+    parser.add_argument(
+        "--no-batch",
+        action="store_true",
+        help="Fact-check concurrently through the regular API instead of the Message Batches API"
+    )
+    args = parser.parse_args()
+    create_sample_debates(use_batch=not args.no_batch)
@@ -1,10 +1,15 @@
 import psycopg2
-from datetime import timezone
-from psycopg2.extras import RealDictCursor
-from datetime import datetime
+import psycopg2.pool
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from psycopg2.extras import RealDictCursor, Json, execute_values, register_default_jsonb
 from typing import Optional, List
-import json
+import orjson
 import os
+import io
+import csv
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -20,607 +25,765 @@ DB_NAME = os.getenv("DB_NAME", "debate_platform")
 DB_USER = os.getenv("DB_USER", "postgres")
 DB_PASSWORD = os.getenv("DB_PASSWORD", "postgres")
 
+# Decode jsonb columns (key_urls) with orjson instead of the stdlib json module
+register_default_jsonb(globally=True, loads=orjson.loads)
+
+# Connection pool bounds (per process)
+DB_POOL_MIN = int(os.getenv("DB_POOL_MIN", "2"))
+DB_POOL_MAX = int(os.getenv("DB_POOL_MAX", "20"))
+
+# Rows fetched per round trip by server-side cursors
+ARGUMENT_FETCH_BATCH_SIZE = 2000
+
+class _PreparingConnection(psycopg2.extensions.connection):
+    """Connection that remembers which named statements it has PREPAREd."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.prepared = set()
+
+_pool: Optional[psycopg2.pool.ThreadedConnectionPool] = None
+_pool_lock = threading.Lock()
+
+def _get_pool() -> psycopg2.pool.ThreadedConnectionPool:
+    """Create the process-wide connection pool on first use."""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = psycopg2.pool.ThreadedConnectionPool(
+                    DB_POOL_MIN,
+                    DB_POOL_MAX,
+                    host=DB_HOST,
+                    port=DB_PORT,
+                    database=DB_NAME,
+                    user=DB_USER,
+                    password=DB_PASSWORD,
+                    connection_factory=_PreparingConnection
+                )
+    return _pool
+
 def get_db_connection():
-    """Get a database connection."""
-    conn = psycopg2.connect(
-        host=DB_HOST,
-        port=DB_PORT,
-        database=DB_NAME,
-        user=DB_USER,
-        password=DB_PASSWORD
-    )
-    return conn
-
-def _format_datetime_to_iso(dt) -> Optional[str]:
-    """Convert datetime object to ISO format string."""
-    if dt is None:
-        return None
-    if isinstance(dt, datetime):
-        return dt.isoformat()
-    return str(dt) if dt else None
+    """Get a pooled database connection. Return it with release_db_connection()."""
+    return _get_pool().getconn()
 
-def init_db():
-    """Initialize the database with tables."""
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    
-    # Create topics table
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS topics (
-            id SERIAL PRIMARY KEY,
-            question TEXT NOT NULL,
-            created_by TEXT NOT NULL,
-            created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
-            overall_summary TEXT,
-            consensus_view TEXT,
-            timeline_view TEXT
-        )
-    """)
-    
-    # Create arguments table
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS arguments (
-            id SERIAL PRIMARY KEY,
-            topic_id INTEGER NOT NULL,
-            side TEXT NOT NULL CHECK(side IN ('pro', 'con')),
-            title TEXT NOT NULL,
-            content TEXT NOT NULL,
-            sources TEXT,
-            author TEXT NOT NULL,
-            created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (topic_id) REFERENCES topics(id) ON DELETE CASCADE
-        )
-    """)
-
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS comments (
-            id SERIAL PRIMARY KEY,
-            argument_id INTEGER NOT NULL,
-            comment TEXT NOT NULL,
-            created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (argument_id) REFERENCES arguments(id) ON DELETE CASCADE
-        )
-    """)
-    
-    conn.commit()
-    cursor.close()
-    conn.close()
-
-def ensure_argument_matches_table():
-    """Ensure the argument_matches table exists (safe to call repeatedly)."""
+def release_db_connection(conn):
+    """Return a connection obtained from get_db_connection() to the pool."""
+    _get_pool().putconn(conn)
+
+def close_pool():
+    """Close all pooled connections. Called on application shutdown."""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.closeall()
+            _pool = None
+
+@contextmanager
+def db_cursor(dict_cursor: bool = False, name: Optional[str] = None):
+    """
+    Yield (conn, cursor) on a pooled connection.
+    Pass name to get a server-side (named) cursor that fetches rows in batches.
+    Commits on success, rolls back on error, and always returns the connection to the pool.
+    """
     conn = get_db_connection()
-    cursor = conn.cursor()
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS argument_matches (
-            id SERIAL PRIMARY KEY,
-            topic_id INTEGER NOT NULL,
-            pro_id INTEGER NOT NULL,
-            con_id INTEGER NOT NULL,
-            reason TEXT,
-            created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (topic_id) REFERENCES topics(id) ON DELETE CASCADE
-        )
-    """)
-    conn.commit()
-    cursor.close()
-    conn.close()
+    try:
+        cursor = conn.cursor(name=name, cursor_factory=RealDictCursor if dict_cursor else None)
+        try:
+            yield conn, cursor
+        finally:
+            # Close before the commit/rollback: ending the transaction invalidates a
+            # named cursor, and closing it afterwards raises
+            cursor.close()
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        release_db_connection(conn)
+
+# In-process caches for topic reads. Writes in this process invalidate them; the
+# TTLs bound how long writes made by other workers take to show up.
+TOPIC_CACHE_TTL = int(os.getenv("TOPIC_CACHE_TTL", "30"))
+TOPIC_LIST_CACHE_TTL = int(os.getenv("TOPIC_LIST_CACHE_TTL", "5"))
+TOPIC_CACHE_MAX_ENTRIES = 2048
+
+_topic_versions = {}
+_topic_cache: "OrderedDict[tuple, Optional[dict]]" = OrderedDict()
+_topic_list_cache: Optional[tuple] = None  # (expires_at, topics)
+_cache_lock = threading.Lock()
+_MISSING = object()
+
+def _topic_cache_key(topic_id: int) -> Optional[tuple]:
+    """Key a topic read by its write version and the current TTL window (None when the cache is off)."""
+    if TOPIC_CACHE_TTL <= 0:
+        return None
+    return (topic_id, _topic_versions.get(topic_id, 0), int(time.monotonic() // TOPIC_CACHE_TTL))
+
+def _get_cached_topic(key: Optional[tuple]):
+    """Return a copy of the cached topic (None if it didn't exist), or _MISSING."""
+    if key is None:
+        return _MISSING
+    with _cache_lock:
+        topic = _topic_cache.get(key, _MISSING)
+        if topic is not _MISSING:
+            _topic_cache.move_to_end(key)
+    if topic is _MISSING or topic is None:
+        return topic
+    return dict(topic)
+
+def _cache_topic(key: Optional[tuple], topic: Optional[dict]):
+    if key is None:
+        return
+    with _cache_lock:
+        _topic_cache[key] = dict(topic) if topic else None
+        _topic_cache.move_to_end(key)
+        while len(_topic_cache) > TOPIC_CACHE_MAX_ENTRIES:
+            _topic_cache.popitem(last=False)
+
+def _get_cached_topic_list() -> Optional[list]:
+    """Return a copy of the cached topic list if it hasn't expired."""
+    cached = _topic_list_cache
+    if cached is None or cached[0] < time.monotonic():
+        return None
+    return [dict(topic) for topic in cached[1]]
+
+def _cache_topic_list(topics: list):
+    global _topic_list_cache
+    _topic_list_cache = (time.monotonic() + TOPIC_LIST_CACHE_TTL, [dict(topic) for topic in topics])
+
+def invalidate_topic_cache(topic_id: Optional[int] = None):
+    """Drop cached topic reads after a write. Pass topic_id when that topic's row changed."""
+    global _topic_list_cache
+    with _cache_lock:
+        if topic_id is not None:
+            _topic_versions[topic_id] = _topic_versions.get(topic_id, 0) + 1
+        _topic_list_cache = None
+
+# Votes and validity verdicts are cheap to redo, so their transactions don't wait
+# for the WAL flush. A server crash can lose the last few of them, never corrupt data.
+_RELAXED_COMMIT = "SET LOCAL synchronous_commit TO OFF"
+
+def _row_to_dict(cursor, row) -> Optional[dict]:
+    """Name a tuple row's fields from the cursor description (cheaper than RealDictCursor)."""
+    if row is None:
+        return None
+    return dict(zip([column.name for column in cursor.description], row))
+
+def _rows_to_dicts(cursor, rows) -> List[dict]:
+    """Name the fields of many tuple rows from the cursor description."""
+    columns = [column.name for column in cursor.description]
+    return [dict(zip(columns, row)) for row in rows]
+
+def _dumps_json(value) -> str:
+    """Serialize a value for a jsonb parameter."""
+    return orjson.dumps(value).decode()
+
+# Explicit column lists for row reads. Timestamps are rendered as ISO 8601 text by
+# PostgreSQL (the same format as in the jsonb detail payload) and missing key_urls
+# come back as [], so rows need no per-field conversion in Python.
+_TOPIC_COLUMNS = """id, question, created_by, to_jsonb(created_at) #>> '{}' AS created_at,
+    overall_summary, consensus_view, timeline_view"""
+_ARGUMENT_COLUMNS = """id, topic_id, side, title, content, sources, author,
+    to_jsonb(created_at) #>> '{}' AS created_at,
+    validity_score, validity_reasoning,
+    to_jsonb(validity_checked_at) #>> '{}' AS validity_checked_at,
+    COALESCE(key_urls, '[]'::jsonb) AS key_urls, votes"""
+
+# Hot single-row statements, prepared once per pooled connection so the server
+# parses and plans them only on first use
+_PREPARED_STATEMENTS = {
+    'get_topic_stmt': f"SELECT {_TOPIC_COLUMNS} FROM topics WHERE id = $1",
+    'get_argument_stmt': f"SELECT {_ARGUMENT_COLUMNS} FROM arguments WHERE id = $1",
+    'create_argument_stmt': """INSERT INTO arguments (topic_id, side, title, content, sources, author)
+        VALUES ($1, $2, $3, $4, $5, $6) RETURNING id""",
+    'update_argument_validity_stmt': f"""UPDATE arguments
+        SET validity_score = $1, validity_reasoning = $2, validity_checked_at = timezone('UTC', now()), key_urls = $3
+        WHERE id = $4
+        RETURNING {_ARGUMENT_COLUMNS}""",
+}
+
+def _execute_prepared(cursor, name: str, params: tuple):
+    """EXECUTE a statement from _PREPARED_STATEMENTS, preparing it on this connection first if needed."""
+    conn = cursor.connection
+    if name not in conn.prepared:
+        cursor.execute(f"PREPARE {name} AS {_PREPARED_STATEMENTS[name]}")
+        conn.prepared.add(name)
+    placeholders = ", ".join(["%s"] * len(params))
+    cursor.execute(f"EXECUTE {name} ({placeholders})", params)
+
+# Set once the schema has been created/migrated in this process
+_schema_ready = False
+
+# Advisory lock key held while ensure_schema() runs, so workers don't run DDL concurrently
+_SCHEMA_LOCK_ID = 7310041
+
+# Schema DDL, kept as single multi-statement scripts so ensure_schema() sends it in one round trip
+_CREATE_TABLES_SQL = """
+    CREATE TABLE IF NOT EXISTS topics (
+        id SERIAL PRIMARY KEY,
+        question TEXT NOT NULL,
+        created_by TEXT NOT NULL,
+        created_at TIMESTAMP NOT NULL DEFAULT timezone('UTC', now()),
+        overall_summary TEXT,
+        consensus_view TEXT,
+        timeline_view TEXT
+    );
+
+    CREATE TABLE IF NOT EXISTS arguments (
+        id SERIAL PRIMARY KEY,
+        topic_id INTEGER NOT NULL,
+        side TEXT NOT NULL CHECK(side IN ('pro', 'con')),
+        title TEXT NOT NULL,
+        content TEXT NOT NULL,
+        sources TEXT,
+        author TEXT NOT NULL,
+        created_at TIMESTAMP NOT NULL DEFAULT timezone('UTC', now()),
+        FOREIGN KEY (topic_id) REFERENCES topics(id) ON DELETE CASCADE
+    );
+    -- Leave free space in each page so vote updates can rewrite the row in place
+    -- (HOT updates) instead of moving it and touching every index. Only altered once:
+    -- ALTER TABLE takes an ACCESS EXCLUSIVE lock
+    DO $$
+    BEGIN
+        IF NOT EXISTS (
+            SELECT 1 FROM pg_class
+            WHERE oid = 'arguments'::regclass AND 'fillfactor=90' = ANY(reloptions)
+        ) THEN
+            ALTER TABLE arguments SET (fillfactor = 90);
+        END IF;
+    END $$;
+
+    CREATE TABLE IF NOT EXISTS argument_matches (
+        id SERIAL PRIMARY KEY,
+        topic_id INTEGER NOT NULL,
+        pro_id INTEGER NOT NULL,
+        con_id INTEGER NOT NULL,
+        reason TEXT,
+        created_at TIMESTAMP NOT NULL DEFAULT timezone('UTC', now()),
+        FOREIGN KEY (topic_id) REFERENCES topics(id) ON DELETE CASCADE
+    );
+
+    CREATE TABLE IF NOT EXISTS comments (
+        id SERIAL PRIMARY KEY,
+        argument_id INTEGER NOT NULL,
+        comment TEXT NOT NULL,
+        created_at TIMESTAMP NOT NULL DEFAULT timezone('UTC', now()),
+        FOREIGN KEY (argument_id) REFERENCES arguments(id) ON DELETE CASCADE
+    );
+"""
+
+# Adds the validity and votes columns in one statement, and moves tables created with
+# the old session-local CURRENT_TIMESTAMP defaults to UTC
+_MIGRATE_ARGUMENT_COLUMNS_SQL = """
+    DO $$
+    DECLARE
+        tbl text;
+    BEGIN
+        FOREACH tbl IN ARRAY ARRAY['topics', 'arguments', 'argument_matches', 'comments'] LOOP
+            -- Skip tables already migrated, so a routine boot takes no ACCESS EXCLUSIVE lock
+            IF NOT EXISTS (
+                SELECT 1 FROM information_schema.columns c
+                WHERE c.table_schema = 'public' AND c.table_name = tbl
+                  AND c.column_name = 'created_at' AND c.column_default LIKE 'timezone(%'
+            ) THEN
+                EXECUTE format('ALTER TABLE %I ALTER COLUMN created_at SET DEFAULT timezone(''UTC'', now())', tbl);
+            END IF;
+        END LOOP;
+    END $$;
+
+    ALTER TABLE arguments
+        ADD COLUMN IF NOT EXISTS validity_score INTEGER,
+        ADD COLUMN IF NOT EXISTS validity_reasoning TEXT,
+        ADD COLUMN IF NOT EXISTS validity_checked_at TIMESTAMP,
+        ADD COLUMN IF NOT EXISTS key_urls JSONB,
+        ADD COLUMN IF NOT EXISTS votes INTEGER DEFAULT 0;
+
+    -- key_urls used to hold JSON text; convert it in place
+    DO $$
+    BEGIN
+        IF EXISTS (
+            SELECT 1 FROM information_schema.columns
+            WHERE table_schema = 'public' AND table_name = 'arguments'
+              AND column_name = 'key_urls' AND data_type = 'text'
+        ) THEN
+            ALTER TABLE arguments ALTER COLUMN key_urls TYPE JSONB USING key_urls::jsonb;
+        END IF;
+    END $$;
+"""
+
+# Indexes for the per-topic read paths (needs the migrated columns)
+_CREATE_INDEXES_SQL = """
+    -- Match the created_at ordering of get_arguments, with and without a side filter
+    DROP INDEX IF EXISTS idx_arguments_topic_side;
+    CREATE INDEX IF NOT EXISTS idx_arguments_topic_created ON arguments(topic_id, created_at);
+    CREATE INDEX IF NOT EXISTS idx_arguments_topic_side_created ON arguments(topic_id, side, created_at);
+    -- Matches ORDER BY validity_score DESC NULLS LAST, created_at DESC used by the sorted reads
+    CREATE INDEX IF NOT EXISTS idx_arguments_topic_validity
+        ON arguments(topic_id, validity_score DESC NULLS LAST, created_at DESC);
+    CREATE INDEX IF NOT EXISTS idx_argument_matches_topic ON argument_matches(topic_id);
+"""
+
+_SCHEMA_SQL = _CREATE_TABLES_SQL + _MIGRATE_ARGUMENT_COLUMNS_SQL + _CREATE_INDEXES_SQL
+
+def ensure_schema():
+    """
+    Create tables and run all migrations in a single transaction, once per process.
+    Later calls return immediately without touching the database. Concurrent callers
+    in other processes are serialized by a Postgres advisory lock.
+    """
+    global _schema_ready
+    if _schema_ready:
+        return
+
+    with db_cursor() as (conn, cursor):
+        # Workers starting together take turns; the lock is released on commit
+        cursor.execute("SELECT pg_advisory_xact_lock(%s)", (_SCHEMA_LOCK_ID,))
+        # psycopg2 has no executescript(), but it sends a multi-statement string as one query
+        cursor.execute(_SCHEMA_SQL)
+    _schema_ready = True
 
 def get_topic(topic_id: int) -> Optional[dict]:
-    """Get a topic by ID."""
-    conn = get_db_connection()
-    cursor = conn.cursor(cursor_factory=RealDictCursor)
-    cursor.execute("SELECT * FROM topics WHERE id = %s", (topic_id,))
-    row = cursor.fetchone()
-    cursor.close()
-    conn.close()
-    
-    if row:
-        topic = dict(row)
-        topic['created_at'] = _format_datetime_to_iso(topic.get('created_at'))
+    """Get a topic by ID (cached in-process until it changes)."""
+    key = _topic_cache_key(topic_id)
+    topic = _get_cached_topic(key)
+    if topic is not _MISSING:
         return topic
-    return None
+
+    with db_cursor() as (conn, cursor):
+        _execute_prepared(cursor, 'get_topic_stmt', (topic_id,))
+        topic = _row_to_dict(cursor, cursor.fetchone())
+    _cache_topic(key, topic)
+    return topic
+
+_CREATE_TOPIC_SQL = f"INSERT INTO topics (question, created_by) VALUES (%s, %s) RETURNING {_TOPIC_COLUMNS}"
 
 def create_topic(question: str, created_by: str) -> dict:
     """Create a new topic and return the full topic data."""
-    conn = get_db_connection()
-    cursor = conn.cursor(cursor_factory=RealDictCursor)
-    cursor.execute(
-        "INSERT INTO topics (question, created_by, created_at) VALUES (%s, %s, %s) RETURNING *",
-        (question, created_by, datetime.now(timezone.utc))
-    )
-    row = cursor.fetchone()
-    conn.commit()
-    cursor.close()
-    conn.close()
-    if row:
-        topic = dict(row)
-        topic['created_at'] = _format_datetime_to_iso(topic.get('created_at'))
-        return topic
-    return None
+    with db_cursor() as (conn, cursor):
+        cursor.execute(
+            _CREATE_TOPIC_SQL,
+            (question, created_by)
+        )
+        topic = _row_to_dict(cursor, cursor.fetchone())
+    if not topic:
+        return None
+    invalidate_topic_cache(topic['id'])
+    return topic
+
+def bulk_create_topics(rows: List[dict]) -> List[int]:
+    """
+    Insert many topics in one statement and return their IDs in input order.
+    Each row has question and created_by.
+    """
+    if not rows:
+        return []
+
+    with db_cursor() as (conn, cursor):
+        # Reserve the IDs up front so they line up with the input rows
+        cursor.execute(
+            "SELECT nextval(pg_get_serial_sequence('topics', 'id')) FROM generate_series(1, %s)",
+            (len(rows),)
+        )
+        topic_ids = [row[0] for row in cursor.fetchall()]
+        execute_values(
+            cursor,
+            "INSERT INTO topics (id, question, created_by) VALUES %s",
+            [(topic_id, row['question'], row['created_by']) for topic_id, row in zip(topic_ids, rows)],
+            page_size=500
+        )
+
+    invalidate_topic_cache()
+    return topic_ids
+
+def _controversy_level(pro_count: int, con_count: int) -> Optional[str]:
+    """Classify how contested a topic is from its pro/con argument counts."""
+    total_count = pro_count + con_count
+    if total_count == 0:
+        return None
+
+    # Calculate balance ratio (closer to 0.5 = more balanced/contested)
+    balance_ratio = min(pro_count, con_count) / total_count
+    if balance_ratio >= 0.4:
+        # Highly balanced (40%+ on both sides)
+        return "Highly Contested"
+    elif balance_ratio >= 0.25:
+        # Moderately balanced (25-40% on smaller side)
+        return "Moderately Contested"
+    # One-sided (less than 25% on smaller side)
+    return "Clear Consensus"
 
 def get_all_topics() -> list:
-    """Get all topics with pro/con counts and validity metrics."""
-    conn = get_db_connection()
-    cursor = conn.cursor(cursor_factory=RealDictCursor)
-    
-    # First get basic topic info with counts
-    cursor.execute("""
-        SELECT 
-            t.id,
-            t.question,
-            t.created_by,
-            t.created_at,
-            COUNT(CASE WHEN a.side = 'pro' THEN 1 END) as pro_count,
-            COUNT(CASE WHEN a.side = 'con' THEN 1 END) as con_count
-        FROM topics t
-        LEFT JOIN arguments a ON t.id = a.topic_id
-        GROUP BY t.id, t.question, t.created_by, t.created_at
-        ORDER BY t.created_at DESC
-    """)
-    
-    topics = [dict(row) for row in cursor.fetchall()]
-    
-    # Convert datetime to ISO string and calculate validity metrics for each topic
-    for topic in topics:
-        topic['created_at'] = _format_datetime_to_iso(topic.get('created_at'))
-        topic_id = topic['id']
-        
-        # Get average validity for PRO arguments
-        cursor.execute("""
-            SELECT AVG(validity_score) as avg_validity
-            FROM arguments
-            WHERE topic_id = %s AND side = 'pro' AND validity_score IS NOT NULL
-        """, (topic_id,))
-        pro_avg_result = cursor.fetchone()
-        pro_avg = pro_avg_result['avg_validity'] if pro_avg_result and pro_avg_result['avg_validity'] is not None else None
-        if pro_avg is not None:
-            topic['pro_avg_validity'] = float(round(pro_avg, 1))
-        else:
-            topic['pro_avg_validity'] = None
-        
-        # Get average validity for CON arguments
+    """Get all topics with pro/con counts and validity metrics (cached for TOPIC_LIST_CACHE_TTL seconds)."""
+    topics = _get_cached_topic_list()
+    if topics is not None:
+        return topics
+
+    with db_cursor() as (conn, cursor):
+        # Counts and per-side average validity in one grouped scan
         cursor.execute("""
-            SELECT AVG(validity_score) as avg_validity
-            FROM arguments
-            WHERE topic_id = %s AND side = 'con' AND validity_score IS NOT NULL
-        """, (topic_id,))
-        con_avg_result = cursor.fetchone()
-        con_avg = con_avg_result['avg_validity'] if con_avg_result and con_avg_result['avg_validity'] is not None else None
-        if con_avg is not None:
-            topic['con_avg_validity'] = float(round(con_avg, 1))
-        else:
-            topic['con_avg_validity'] = None
-        
-        # Calculate controversy level
-        pro_count = topic['pro_count']
-        con_count = topic['con_count']
-        total_count = pro_count + con_count
-        
-        if total_count == 0:
-            topic['controversy_level'] = None
-        else:
-            # Calculate balance ratio (closer to 0.5 = more balanced/contested)
-            balance_ratio = min(pro_count, con_count) / total_count if total_count > 0 else 0
-            
-            if balance_ratio >= 0.4:
-                # Highly balanced (40%+ on both sides)
-                topic['controversy_level'] = "Highly Contested"
-            elif balance_ratio >= 0.25:
-                # Moderately balanced (25-40% on smaller side)
-                topic['controversy_level'] = "Moderately Contested"
-            else:
-                # One-sided (less than 25% on smaller side)
-                topic['controversy_level'] = "Clear Consensus"
-    
-    cursor.close()
-    conn.close()
+            SELECT
+                t.id,
+                t.question,
+                t.created_by,
+                to_jsonb(t.created_at) #>> '{}' as created_at,
+                COUNT(*) FILTER (WHERE a.side = 'pro') as pro_count,
+                COUNT(*) FILTER (WHERE a.side = 'con') as con_count,
+                ROUND(AVG(a.validity_score) FILTER (WHERE a.side = 'pro'), 1) as pro_avg_validity,
+                ROUND(AVG(a.validity_score) FILTER (WHERE a.side = 'con'), 1) as con_avg_validity
+            FROM topics t
+            LEFT JOIN arguments a ON t.id = a.topic_id
+            GROUP BY t.id
+            ORDER BY t.created_at DESC
+        """)
+        topics = _rows_to_dicts(cursor, cursor.fetchall())
+
+    for topic in topics:
+        # AVG returns Decimal (NULL values are ignored, so no scored arguments gives None)
+        for key in ('pro_avg_validity', 'con_avg_validity'):
+            if topic[key] is not None:
+                topic[key] = float(topic[key])
+        topic['controversy_level'] = _controversy_level(topic['pro_count'], topic['con_count'])
+
+    _cache_topic_list(topics)
     return topics
 
+# One side's arguments as a JSON array, best-validated first (unverified last)
+_SIDE_ARGUMENTS_JSON = """
+    COALESCE((
+        SELECT jsonb_agg(
+            to_jsonb(a) || jsonb_build_object('key_urls', COALESCE(a.key_urls, '[]'::jsonb))
+            ORDER BY a.validity_score DESC NULLS LAST, a.created_at DESC
+        )
+        FROM arguments a
+        WHERE a.topic_id = t.id AND a.side = '{side}'
+    ), '[]'::jsonb)
+"""
+
+# The whole topic detail tree as one jsonb value; callers append their own WHERE t.id = ...
+_TOPIC_WITH_ARGUMENTS_SELECT = f"""
+    SELECT jsonb_build_object(
+        'id', t.id,
+        'question', t.question,
+        'created_by', t.created_by,
+        'created_at', t.created_at,
+        'pro_arguments', {_SIDE_ARGUMENTS_JSON.format(side='pro')},
+        'con_arguments', {_SIDE_ARGUMENTS_JSON.format(side='con')},
+        'overall_summary', t.overall_summary,
+        'consensus_view', t.consensus_view,
+        'timeline_view', t.timeline_view
+    )::text
+    FROM topics t
+"""
+_TOPIC_WITH_ARGUMENTS_SQL = _TOPIC_WITH_ARGUMENTS_SELECT + "WHERE t.id = %s"
+
+def _parse_topic_tree(payload: str) -> dict:
+    """
+    Parse the topic detail tree. timeline_view arrives as the column's raw text and
+    is parsed here, so a malformed legacy value becomes None instead of failing the query.
+    """
+    topic = orjson.loads(payload)
+    if topic.get('timeline_view'):
+        try:
+            topic['timeline_view'] = orjson.loads(topic['timeline_view'])
+        except orjson.JSONDecodeError:
+            topic['timeline_view'] = None
+    return topic
+
 def get_topic_with_arguments(topic_id: int) -> Optional[dict]:
     """Get a topic with its arguments, sorted by validity score (highest first)."""
-    topic = get_topic(topic_id)
-    if not topic:
+    # PostgreSQL assembles the whole response tree; it comes back as text and is parsed once
+    with db_cursor() as (conn, cursor):
+        cursor.execute(_TOPIC_WITH_ARGUMENTS_SQL, (topic_id,))
+        row = cursor.fetchone()
+
+    if not row:
         return None
-    
-    conn = get_db_connection()
-    cursor = conn.cursor(cursor_factory=RealDictCursor)
-    # Sort by validity_score DESC (nulls last), then created_at DESC
-    cursor.execute("""
-        SELECT * FROM arguments 
-        WHERE topic_id = %s 
-        ORDER BY 
-            CASE WHEN validity_score IS NULL THEN 1 ELSE 0 END,
-            validity_score DESC,
-            created_at DESC
-    """, (topic_id,))
-    rows = cursor.fetchall()
-    cursor.close()
-    conn.close()
-    
-    arguments = [dict(row) for row in rows]
-    # Parse key_urls JSON and convert timestamps for each argument
-    for arg in arguments:
-        if arg.get('key_urls'):
-            try:
-                arg['key_urls'] = json.loads(arg['key_urls'])
-            except (json.JSONDecodeError, TypeError):
-                arg['key_urls'] = []
-        else:
-            arg['key_urls'] = []
-        # Convert datetime fields to ISO strings
-        arg['created_at'] = _format_datetime_to_iso(arg.get('created_at'))
-        arg['validity_checked_at'] = _format_datetime_to_iso(arg.get('validity_checked_at'))
-    
-    pro_arguments = [arg for arg in arguments if arg['side'] == 'pro']
-    con_arguments = [arg for arg in arguments if arg['side'] == 'con']
-    
-    # Parse timeline_view if it exists
-    timeline_view = None
-    if topic.get('timeline_view'):
-        try:
-            timeline_view = json.loads(topic['timeline_view'])
-        except (json.JSONDecodeError, TypeError):
-            timeline_view = None
-    
-    return {
-        'id': topic['id'],
-        'question': topic['question'],
-        'created_by': topic['created_by'],
-        'created_at': _format_datetime_to_iso(topic.get('created_at')),
-        'pro_arguments': pro_arguments,
-        'con_arguments': con_arguments,
-        'overall_summary': topic.get('overall_summary'),
-        'consensus_view': topic.get('consensus_view'),
-        'timeline_view': timeline_view
-    }
+    return _parse_topic_tree(row[0])
 
 def create_argument(topic_id: int, side: str, title: str, content: str, author: str, sources: Optional[str] = None) -> int:
     """Create a new argument and return its ID."""
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    cursor.execute(
-        """INSERT INTO arguments (topic_id, side, title, content, sources, author, created_at) 
-           VALUES (%s, %s, %s, %s, %s, %s, %s) RETURNING id""",
-        (topic_id, side, title, content, sources, author, datetime.now(timezone.utc))
-    )
-    argument_id = cursor.fetchone()[0]
-    conn.commit()
-    cursor.close()
-    conn.close()
+    with db_cursor() as (conn, cursor):
+        _execute_prepared(
+            cursor,
+            'create_argument_stmt',
+            (topic_id, side, title, content, sources, author)
+        )
+        argument_id = cursor.fetchone()[0]
+    # Topic list counts changed
+    invalidate_topic_cache()
     return argument_id
 
-def get_arguments(topic_id: int, side: Optional[str] = None) -> list:
-    """Get arguments for a topic, optionally filtered by side."""
-    conn = get_db_connection()
-    cursor = conn.cursor(cursor_factory=RealDictCursor)
-    
-    if side and side in ['pro', 'con']:
+def bulk_create_arguments(rows: List[dict]) -> List[int]:
+    """
+    Insert many arguments with one COPY and return their IDs in input order.
+    Each row has topic_id, side, title, content, author and optionally sources.
+    """
+    if not rows:
+        return []
+
+    with db_cursor() as (conn, cursor):
+        # Reserve the IDs up front so they line up with the input rows
         cursor.execute(
-            "SELECT * FROM arguments WHERE topic_id = %s AND side = %s ORDER BY created_at ASC",
-            (topic_id, side)
+            "SELECT nextval(pg_get_serial_sequence('arguments', 'id')) FROM generate_series(1, %s)",
+            (len(rows),)
         )
-    else:
-        cursor.execute(
-            "SELECT * FROM arguments WHERE topic_id = %s ORDER BY created_at ASC",
-            (topic_id,)
+        argument_ids = [row[0] for row in cursor.fetchall()]
+
+        # None is written as \N, which the COPY below reads back as NULL
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for argument_id, row in zip(argument_ids, rows):
+            writer.writerow((
+                argument_id,
+                row['topic_id'],
+                row['side'],
+                row['title'],
+                row['content'],
+                '\\N' if row.get('sources') is None else row['sources'],
+                row['author']
+            ))
+        buffer.seek(0)
+        # created_at is left to the column default
+        cursor.copy_expert(
+            "COPY arguments (id, topic_id, side, title, content, sources, author) FROM STDIN WITH (FORMAT csv, NULL '\\N')",
+            buffer
         )
-    
-    rows = cursor.fetchall()
-    cursor.close()
-    conn.close()
-    arguments = [dict(row) for row in rows]
-    # Convert datetime to ISO string for each argument
-    for arg in arguments:
-        arg['created_at'] = _format_datetime_to_iso(arg.get('created_at'))
-        arg['validity_checked_at'] = _format_datetime_to_iso(arg.get('validity_checked_at'))
-    return arguments
 
-def get_argument_counts(topic_id: int) -> dict:
-    """Get pro and con argument counts for a topic."""
-    conn = get_db_connection()
-    cursor = conn.cursor(cursor_factory=RealDictCursor)
-    cursor.execute("""
-        SELECT 
-            COUNT(CASE WHEN side = 'pro' THEN 1 END) as pro_count,
-            COUNT(CASE WHEN side = 'con' THEN 1 END) as con_count
-        FROM arguments
-        WHERE topic_id = %s
-    """, (topic_id,))
-    row = cursor.fetchone()
-    cursor.close()
-    conn.close()
-    return dict(row) if row else {'pro_count': 0, 'con_count': 0}
+    # Topic list counts changed
+    invalidate_topic_cache()
+    return argument_ids
+
+_ARGUMENTS_SQL = f"SELECT {_ARGUMENT_COLUMNS} FROM arguments WHERE topic_id = %s ORDER BY arguments.created_at ASC"
+_ARGUMENTS_BY_SIDE_SQL = f"SELECT {_ARGUMENT_COLUMNS} FROM arguments WHERE topic_id = %s AND side = %s ORDER BY arguments.created_at ASC"
+
+def get_arguments(topic_id: int, side: Optional[str] = None) -> list:
+    """Get arguments for a topic, optionally filtered by side."""
+    with db_cursor() as (conn, cursor):
+        if side and side in ['pro', 'con']:
+            cursor.execute(_ARGUMENTS_BY_SIDE_SQL, (topic_id, side))
+        else:
+            cursor.execute(_ARGUMENTS_SQL, (topic_id,))
+        return _rows_to_dicts(cursor, cursor.fetchall())
 
 def update_topic_analysis(topic_id: int, overall_summary: str, consensus_view: str, timeline_view: list):
     """Update topic with generated analysis."""
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    timeline_json = json.dumps(timeline_view) if timeline_view else None
-    cursor.execute(
-        """UPDATE topics 
-           SET overall_summary = %s, consensus_view = %s, timeline_view = %s
-           WHERE id = %s""",
-        (overall_summary, consensus_view, timeline_json, topic_id)
-    )
-    conn.commit()
-    cursor.close()
-    conn.close()
-
-def migrate_add_validity_columns():
-    """Add validity-related columns to arguments table if they don't exist."""
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    
-    try:
-        # Check if columns exist using PostgreSQL information_schema
-        cursor.execute("""
-            SELECT column_name 
-            FROM information_schema.columns 
-            WHERE table_name = 'arguments' AND table_schema = 'public'
-        """)
-        columns = [row[0] for row in cursor.fetchall()]
-        
-        # Add columns if they don't exist
-        if 'validity_score' not in columns:
-            cursor.execute("ALTER TABLE arguments ADD COLUMN validity_score INTEGER")
-        if 'validity_reasoning' not in columns:
-            cursor.execute("ALTER TABLE arguments ADD COLUMN validity_reasoning TEXT")
-        if 'validity_checked_at' not in columns:
-            cursor.execute("ALTER TABLE arguments ADD COLUMN validity_checked_at TIMESTAMP")
-        if 'key_urls' not in columns:
-            cursor.execute("ALTER TABLE arguments ADD COLUMN key_urls TEXT")
-        
-        conn.commit()
-    except Exception as e:
-        # If error occurs, rollback
-        conn.rollback()
-        raise
-    finally:
-        cursor.close()
-        conn.close()
-
-def migrate_add_votes_column():
-    """Add votes column to arguments table if it doesn't exist."""
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    
-    try:
-        cursor.execute("""
-            SELECT column_name 
-            FROM information_schema.columns 
-            WHERE table_name = 'arguments' AND table_schema = 'public'
-        """)
-        columns = [row[0] for row in cursor.fetchall()]
-        
-        if 'votes' not in columns:
-            cursor.execute("ALTER TABLE arguments ADD COLUMN votes INTEGER DEFAULT 0")
-            conn.commit()
-    except Exception as e:
-        conn.rollback()
-        raise
-    finally:
-        cursor.close()
-        conn.close()
+    timeline_json = _dumps_json(timeline_view) if timeline_view else None
+    with db_cursor() as (conn, cursor):
+        cursor.execute(
+            """UPDATE topics
+               SET overall_summary = %s, consensus_view = %s, timeline_view = %s
+               WHERE id = %s""",
+            (overall_summary, consensus_view, timeline_json, topic_id)
+        )
+    invalidate_topic_cache(topic_id)
 
 def get_argument(argument_id: int) -> Optional[dict]:
     """Get a single argument by ID."""
-    conn = get_db_connection()
-    cursor = conn.cursor(cursor_factory=RealDictCursor)
-    cursor.execute("SELECT * FROM arguments WHERE id = %s", (argument_id,))
-    row = cursor.fetchone()
-    cursor.close()
-    conn.close()
-    
-    if row:
-        arg = dict(row)
-        # Parse key_urls JSON if it exists
-        if arg.get('key_urls'):
-            try:
-                arg['key_urls'] = json.loads(arg['key_urls'])
-            except (json.JSONDecodeError, TypeError):
-                arg['key_urls'] = []
-        else:
-            arg['key_urls'] = []
-        # Convert datetime fields to ISO strings
-        arg['created_at'] = _format_datetime_to_iso(arg.get('created_at'))
-        arg['validity_checked_at'] = _format_datetime_to_iso(arg.get('validity_checked_at'))
-        return arg
-    return None
+    with db_cursor() as (conn, cursor):
+        _execute_prepared(cursor, 'get_argument_stmt', (argument_id,))
+        return _row_to_dict(cursor, cursor.fetchone())
+
+def argument_exists(argument_id: int) -> bool:
+    """Check that an argument exists without fetching any of its columns."""
+    with db_cursor() as (conn, cursor):
+        cursor.execute("SELECT 1 FROM arguments WHERE id = %s", (argument_id,))
+        return cursor.fetchone() is not None
 
 def update_argument(argument_id: int, title: str, content: str, sources: Optional[str] = None):
     """Update an argument's title, content, and sources."""
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    cursor.execute(
-        """UPDATE arguments 
-           SET title = %s, content = %s, sources = %s
-           WHERE id = %s""",
-        (title, content, sources, argument_id)
-    )
-    conn.commit()
-    cursor.close()
-    conn.close()
-
-def update_argument_validity(argument_id: int, validity_score: int, validity_reasoning: str, key_urls: Optional[List[str]] = None):
-    """Update argument validity fields."""
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    
-    # Convert key_urls list to JSON string
-    key_urls_json = json.dumps(key_urls) if key_urls else None
-    
-    cursor.execute(
-        """UPDATE arguments 
-           SET validity_score = %s, validity_reasoning = %s, validity_checked_at = %s, key_urls = %s
-           WHERE id = %s""",
-        (validity_score, validity_reasoning, datetime.now(timezone.utc), key_urls_json, argument_id)
-    )
-    conn.commit()
-    cursor.close()
-    conn.close()
+    with db_cursor() as (conn, cursor):
+        cursor.execute(
+            """UPDATE arguments
+               SET title = %s, content = %s, sources = %s
+               WHERE id = %s""",
+            (title, content, sources, argument_id)
+        )
+
+def update_argument_validity(argument_id: int, validity_score: int, validity_reasoning: str, key_urls: Optional[List[str]] = None) -> Optional[dict]:
+    """Update argument validity fields and return the updated argument (None if it doesn't exist)."""
+    # Adapt the key_urls list to jsonb
+    key_urls_json = Json(key_urls, dumps=_dumps_json) if key_urls else None
+
+    with db_cursor() as (conn, cursor):
+        cursor.execute(_RELAXED_COMMIT)
+        _execute_prepared(
+            cursor,
+            'update_argument_validity_stmt',
+            (validity_score, validity_reasoning, key_urls_json, argument_id)
+        )
+        argument = _row_to_dict(cursor, cursor.fetchone())
+    # Topic list validity averages changed
+    invalidate_topic_cache()
+    return argument
+
+def bulk_update_argument_validity(verdicts: List[tuple]):
+    """
+    Update validity fields for many arguments in one transaction.
+    verdicts is a list of (argument_id, validity_score, validity_reasoning, key_urls) tuples.
+    Rows are streamed into a temp table with COPY and applied with a single UPDATE ... FROM.
+    """
+    if not verdicts:
+        return
+
+    # None is written as \N, which the COPY below reads back as NULL
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for argument_id, validity_score, validity_reasoning, key_urls in verdicts:
+        writer.writerow((
+            argument_id,
+            '\\N' if validity_score is None else validity_score,
+            '\\N' if validity_reasoning is None else validity_reasoning,
+            _dumps_json(key_urls) if key_urls else '\\N'
+        ))
+    buffer.seek(0)
+
+    with db_cursor() as (conn, cursor):
+        cursor.execute(_RELAXED_COMMIT)
+        cursor.execute("""
+            CREATE TEMP TABLE _tmp_validity (
+                id INTEGER PRIMARY KEY,
+                score INTEGER,
+                reasoning TEXT,
+                urls JSONB
+            ) ON COMMIT DROP
+        """)
+        cursor.copy_expert("COPY _tmp_validity (id, score, reasoning, urls) FROM STDIN WITH (FORMAT csv, NULL '\\N')", buffer)
+        cursor.execute(
+            """UPDATE arguments
+               SET validity_score = t.score, validity_reasoning = t.reasoning, validity_checked_at = timezone('UTC', now()), key_urls = t.urls
+               FROM _tmp_validity t
+               WHERE arguments.id = t.id"""
+        )
+    invalidate_topic_cache()
+
+_ARGUMENTS_BY_VALIDITY_SQL = f"""
+    SELECT {_ARGUMENT_COLUMNS} FROM arguments
+    WHERE topic_id = %s
+    ORDER BY validity_score DESC NULLS LAST, arguments.created_at DESC
+"""
+_ARGUMENTS_BY_VALIDITY_SIDE_SQL = f"""
+    SELECT {_ARGUMENT_COLUMNS} FROM arguments
+    WHERE topic_id = %s AND side = %s
+    ORDER BY validity_score DESC NULLS LAST, arguments.created_at DESC
+"""
 
 def get_arguments_sorted_by_validity(topic_id: int, side: Optional[str] = None) -> list:
     """Get arguments sorted by validity score (highest first, unverified at end)."""
-    conn = get_db_connection()
-    cursor = conn.cursor(cursor_factory=RealDictCursor)
-    
-    if side and side in ['pro', 'con']:
-        cursor.execute("""
-            SELECT * FROM arguments 
-            WHERE topic_id = %s AND side = %s
-            ORDER BY 
-                CASE WHEN validity_score IS NULL THEN 1 ELSE 0 END,
-                validity_score DESC,
-                created_at DESC
-        """, (topic_id, side))
-    else:
-        cursor.execute("""
-            SELECT * FROM arguments 
-            WHERE topic_id = %s
-            ORDER BY 
-                CASE WHEN validity_score IS NULL THEN 1 ELSE 0 END,
-                validity_score DESC,
-                created_at DESC
-        """, (topic_id,))
-    
-    rows = cursor.fetchall()
-    cursor.close()
-    conn.close()
-    
-    arguments = [dict(row) for row in rows]
-    # Parse key_urls JSON and convert timestamps for each argument
-    for arg in arguments:
-        if arg.get('key_urls'):
-            try:
-                arg['key_urls'] = json.loads(arg['key_urls'])
-            except (json.JSONDecodeError, TypeError):
-                arg['key_urls'] = []
+    # Server-side cursor: large topics are streamed in batches instead of one big fetchall
+    with db_cursor(name='arguments_by_validity') as (conn, cursor):
+        if side and side in ['pro', 'con']:
+            cursor.execute(_ARGUMENTS_BY_VALIDITY_SIDE_SQL, (topic_id, side))
         else:
-            arg['key_urls'] = []
-        # Convert datetime fields to ISO strings
-        arg['created_at'] = _format_datetime_to_iso(arg.get('created_at'))
-        arg['validity_checked_at'] = _format_datetime_to_iso(arg.get('validity_checked_at'))
-    
+            cursor.execute(_ARGUMENTS_BY_VALIDITY_SQL, (topic_id,))
+
+        arguments = []
+        while True:
+            rows = cursor.fetchmany(ARGUMENT_FETCH_BATCH_SIZE)
+            if not rows:
+                break
+            # A named cursor only has a description once rows have been fetched
+            arguments.extend(_rows_to_dicts(cursor, rows))
+
     return arguments
 
 def get_argument_matches(topic_id: int) -> list:
     """Get persisted argument matches for a topic."""
-    ensure_argument_matches_table()
-    conn = get_db_connection()
-    cursor = conn.cursor(cursor_factory=RealDictCursor)
-    cursor.execute(
-        "SELECT pro_id, con_id, reason FROM argument_matches WHERE topic_id = %s",
-        (topic_id,)
-    )
-    rows = cursor.fetchall()
-    cursor.close()
-    conn.close()
-    return [dict(row) for row in rows]
+    with db_cursor() as (conn, cursor):
+        cursor.execute(
+            "SELECT pro_id, con_id, reason FROM argument_matches WHERE topic_id = %s",
+            (topic_id,)
+        )
+        return [
+            {'pro_id': pro_id, 'con_id': con_id, 'reason': reason}
+            for pro_id, con_id, reason in cursor.fetchall()
+        ]
 
 def save_argument_matches(topic_id: int, matches: list):
     """Save argument matches to database."""
-    ensure_argument_matches_table()
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    
-    # Clear existing matches for this topic
-    cursor.execute("DELETE FROM argument_matches WHERE topic_id = %s", (topic_id,))
-    
-    # Insert new matches
-    for match in matches:
-        cursor.execute(
-            """INSERT INTO argument_matches (topic_id, pro_id, con_id, reason)
-               VALUES (%s, %s, %s, %s)""",
-            (topic_id, match['pro_id'], match['con_id'], match.get('reason'))
-        )
-    
-    conn.commit()
-    cursor.close()
-    conn.close()
+    with db_cursor() as (conn, cursor):
+        # Clear existing matches for this topic
+        cursor.execute("DELETE FROM argument_matches WHERE topic_id = %s", (topic_id,))
+
+        # Insert new matches in one statement (same transaction as the DELETE)
+        if matches:
+            execute_values(
+                cursor,
+                "INSERT INTO argument_matches (topic_id, pro_id, con_id, reason) VALUES %s",
+                [(topic_id, match['pro_id'], match['con_id'], match.get('reason')) for match in matches],
+                page_size=500
+            )
 
 def delete_argument_matches_for_topic(topic_id: int):
     """Delete all argument matches for a topic."""
-    ensure_argument_matches_table()
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    cursor.execute("DELETE FROM argument_matches WHERE topic_id = %s", (topic_id,))
-    conn.commit()
-    cursor.close()
-    conn.close()
+    with db_cursor() as (conn, cursor):
+        cursor.execute("DELETE FROM argument_matches WHERE topic_id = %s", (topic_id,))
+
+def _sum_vote_deltas(deltas: List[tuple]) -> dict:
+    """Combine (argument_id, delta) pairs so each argument is updated once."""
+    totals = {}
+    for argument_id, delta in deltas:
+        totals[argument_id] = totals.get(argument_id, 0) + delta
+    return totals
+
+def apply_vote_deltas(deltas: List[tuple]) -> dict:
+    """
+    Apply many (argument_id, delta) vote changes in one UPDATE.
+    Returns {argument_id: new_vote_count} for the arguments that exist.
+    """
+    totals = _sum_vote_deltas(deltas)
+    if not totals:
+        return {}
+
+    with db_cursor() as (conn, cursor):
+        cursor.execute(_RELAXED_COMMIT)
+        rows = execute_values(
+            cursor,
+            """UPDATE arguments AS a
+               SET votes = a.votes + d.delta
+               FROM (VALUES %s) AS d(id, delta)
+               WHERE a.id = d.id
+               RETURNING a.id, a.votes""",
+            list(totals.items()),
+            fetch=True
+        )
+    return dict(rows)
 
 def upvote_argument(argument_id: int) -> int:
     """Increment vote count for an argument and return new count."""
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    
-    cursor.execute(
-        "UPDATE arguments SET votes = votes + 1 WHERE id = %s RETURNING votes",
-        (argument_id,)
-    )
-    result = cursor.fetchone()
-    votes = result[0] if result else 0
-    
-    conn.commit()
-    cursor.close()
-    conn.close()
-    return votes
+    return apply_vote_deltas([(argument_id, 1)]).get(argument_id, 0)
 
 def downvote_argument(argument_id: int) -> int:
     """Decrement vote count for an argument and return new count."""
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    
-    cursor.execute(
-        "UPDATE arguments SET votes = votes - 1 WHERE id = %s RETURNING votes",
-        (argument_id,)
-    )
-    result = cursor.fetchone()
-    votes = result[0] if result else 0
-    
-    conn.commit()
-    cursor.close()
-    conn.close()
-    return votes
+    return apply_vote_deltas([(argument_id, -1)]).get(argument_id, 0)
 
 def create_comment(argument_id: int, comment: str) -> int:
     """Create a new comment for an argument and return the comment ID."""
-    conn = get_db_connection() 
-    cursor = conn.cursor()
-
-    cursor.execute(
-        """INSERT INTO comments (argument_id, comment, created_at) VALUES (%s, %s, %s) RETURNING id""",
-        (argument_id, comment, datetime.now(timezone.utc))
-    )
-
-    result = cursor.fetchone()
-    comment_id = result[0] if result else None
-    conn.commit()
-    cursor.close()
-    conn.close()
-    return comment_id
+    with db_cursor() as (conn, cursor):
+        cursor.execute(
+            "INSERT INTO comments (argument_id, comment) VALUES (%s, %s) RETURNING id",
+            (argument_id, comment)
+        )
+        result = cursor.fetchone()
+    return result[0] if result else None
 
 def get_comments(argument_id: int) -> list[dict]:
     """Get all comments for an argument, ordered by creation date (oldest first)."""
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    
-    cursor.execute("""
-        SELECT id, argument_id, comment, created_at
-        FROM comments
-        WHERE argument_id = %s
-        ORDER BY created_at ASC
-    """, (argument_id,))
-    
-    rows = cursor.fetchall()
+    with db_cursor() as (conn, cursor):
+        cursor.execute("""
+            SELECT id, argument_id, comment, to_jsonb(created_at) #>> '{}'
+            FROM comments
+            WHERE argument_id = %s
+            ORDER BY created_at ASC
+        """, (argument_id,))
+        rows = cursor.fetchall()
+
     comments = []
     for row in rows:
         comments.append({
             'id': row[0],
             'argument_id': row[1],
             'comment': row[2],
-            'created_at': row[3].isoformat() if row[3] else None
+            'created_at': row[3]
         })
-    
-    cursor.close()
-    conn.close()
-    return comments
\ No newline at end of file
+    return comments
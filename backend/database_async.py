@@ -0,0 +1,178 @@
+"""
+asyncpg versions of the hot read paths and vote updates in database.py.
+
+These run on the event loop instead of blocking it. Rows are decoded from
+PostgreSQL's binary protocol in C, and there is no RealDictCursor row building.
+The pool is opened on application startup (init_pool) and closed on shutdown.
+"""
+from typing import List, Optional
+import asyncpg
+import orjson
+from database import (
+    DB_HOST, DB_PORT, DB_NAME, DB_USER, DB_PASSWORD,
+    _ARGUMENT_COLUMNS, _TOPIC_COLUMNS, _TOPIC_WITH_ARGUMENTS_SELECT, _MISSING,
+    _cache_topic, _cache_topic_list, _controversy_level, _get_cached_topic,
+    _get_cached_topic_list, _parse_topic_tree, _sum_vote_deltas, _topic_cache_key
+)
+
+_pool: Optional[asyncpg.Pool] = None
+
+# Same statements as database.py, with asyncpg's $n placeholders
+_GET_TOPIC_SQL = f"SELECT {_TOPIC_COLUMNS} FROM topics WHERE id = $1"
+_GET_ARGUMENT_SQL = f"SELECT {_ARGUMENT_COLUMNS} FROM arguments WHERE id = $1"
+_ARGUMENTS_SQL = f"SELECT {_ARGUMENT_COLUMNS} FROM arguments WHERE topic_id = $1 ORDER BY arguments.created_at ASC"
+_ARGUMENTS_BY_SIDE_SQL = f"SELECT {_ARGUMENT_COLUMNS} FROM arguments WHERE topic_id = $1 AND side = $2 ORDER BY arguments.created_at ASC"
+_TOPIC_WITH_ARGUMENTS_SQL = _TOPIC_WITH_ARGUMENTS_SELECT + "WHERE t.id = $1"
+
+
+async def _setup_connection(conn: asyncpg.Connection):
+    """Decode/encode jsonb columns (key_urls) with orjson."""
+    await conn.set_type_codec(
+        'jsonb',
+        encoder=lambda value: orjson.dumps(value).decode(),
+        decoder=orjson.loads,
+        schema='pg_catalog'
+    )
+
+
+async def init_pool():
+    """Open the asyncpg connection pool. Called on application startup."""
+    global _pool
+    if _pool is None:
+        _pool = await asyncpg.create_pool(
+            host=DB_HOST,
+            port=int(DB_PORT),
+            database=DB_NAME,
+            user=DB_USER,
+            password=DB_PASSWORD,
+            min_size=5,
+            max_size=20,
+            max_queries=10000,
+            max_inactive_connection_lifetime=600.0,
+            # The only writes on this pool are vote updates (see _RELAXED_COMMIT in database.py)
+            server_settings={'synchronous_commit': 'off'},
+            setup=_setup_connection
+        )
+    return _pool
+
+
+async def close_pool():
+    """Close the asyncpg connection pool. Called on application shutdown."""
+    global _pool
+    if _pool is not None:
+        await _pool.close()
+        _pool = None
+
+
+async def _get_pool() -> asyncpg.Pool:
+    return _pool if _pool is not None else await init_pool()
+
+
+async def get_topic(topic_id: int) -> Optional[dict]:
+    """Get a topic by ID (shares database.py's in-process topic cache)."""
+    key = _topic_cache_key(topic_id)
+    topic = _get_cached_topic(key)
+    if topic is not _MISSING:
+        return topic
+
+    pool = await _get_pool()
+    record = await pool.fetchrow(_GET_TOPIC_SQL, topic_id)
+    topic = dict(record) if record else None
+    _cache_topic(key, topic)
+    return topic
+
+
+async def get_all_topics() -> list:
+    """Get all topics with pro/con counts and validity metrics (shares database.py's list cache)."""
+    topics = _get_cached_topic_list()
+    if topics is not None:
+        return topics
+
+    pool = await _get_pool()
+    records = await pool.fetch("""
+        SELECT
+            t.id,
+            t.question,
+            t.created_by,
+            to_jsonb(t.created_at) #>> '{}' as created_at,
+            COUNT(*) FILTER (WHERE a.side = 'pro') as pro_count,
+            COUNT(*) FILTER (WHERE a.side = 'con') as con_count,
+            ROUND(AVG(a.validity_score) FILTER (WHERE a.side = 'pro'), 1) as pro_avg_validity,
+            ROUND(AVG(a.validity_score) FILTER (WHERE a.side = 'con'), 1) as con_avg_validity
+        FROM topics t
+        LEFT JOIN arguments a ON t.id = a.topic_id
+        GROUP BY t.id
+        ORDER BY t.created_at DESC
+    """)
+
+    topics = []
+    for record in records:
+        topic = dict(record)
+        for key in ('pro_avg_validity', 'con_avg_validity'):
+            if topic[key] is not None:
+                topic[key] = float(topic[key])
+        topic['controversy_level'] = _controversy_level(topic['pro_count'], topic['con_count'])
+        topics.append(topic)
+    _cache_topic_list(topics)
+    return topics
+
+
+async def get_topic_with_arguments(topic_id: int) -> Optional[dict]:
+    """Get a topic with its arguments, sorted by validity score (highest first)."""
+    pool = await _get_pool()
+    payload = await pool.fetchval(_TOPIC_WITH_ARGUMENTS_SQL, topic_id)
+    return _parse_topic_tree(payload) if payload is not None else None
+
+
+async def get_arguments(topic_id: int, side: Optional[str] = None) -> list:
+    """Get arguments for a topic, optionally filtered by side."""
+    pool = await _get_pool()
+    if side and side in ['pro', 'con']:
+        records = await pool.fetch(_ARGUMENTS_BY_SIDE_SQL, topic_id, side)
+    else:
+        records = await pool.fetch(_ARGUMENTS_SQL, topic_id)
+    return [dict(record) for record in records]
+
+
+async def get_argument(argument_id: int) -> Optional[dict]:
+    """Get a single argument by ID."""
+    pool = await _get_pool()
+    record = await pool.fetchrow(_GET_ARGUMENT_SQL, argument_id)
+    return dict(record) if record else None
+
+
+async def argument_exists(argument_id: int) -> bool:
+    """Check that an argument exists without fetching any of its columns."""
+    pool = await _get_pool()
+    return await pool.fetchval("SELECT 1 FROM arguments WHERE id = $1", argument_id) is not None
+
+
+async def apply_vote_deltas(deltas: List[tuple]) -> dict:
+    """
+    Apply many (argument_id, delta) vote changes in one UPDATE.
+    Returns {argument_id: new_vote_count} for the arguments that exist.
+    """
+    totals = _sum_vote_deltas(deltas)
+    if not totals:
+        return {}
+
+    pool = await _get_pool()
+    records = await pool.fetch(
+        """UPDATE arguments AS a
+           SET votes = a.votes + d.delta
+           FROM unnest($1::int[], $2::int[]) AS d(id, delta)
+           WHERE a.id = d.id
+           RETURNING a.id, a.votes""",
+        list(totals.keys()), list(totals.values())
+    )
+    return {record['id']: record['votes'] for record in records}
+
+
+async def upvote_argument(argument_id: int) -> int:
+    """Increment vote count for an argument and return new count."""
+    return (await apply_vote_deltas([(argument_id, 1)])).get(argument_id, 0)
+
+
+async def downvote_argument(argument_id: int) -> int:
+    """Decrement vote count for an argument and return new count."""
+    return (await apply_vote_deltas([(argument_id, -1)])).get(argument_id, 0)
@@ -1,12 +1,26 @@
 import os
 import json
+import orjson
 import re
+import time
+import asyncio
+import functools
+import heapq
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional
-from anthropic import Anthropic
-from tavily import TavilyClient
+from typing import AsyncIterator, Callable, Dict, List, Optional, Tuple
+from anthropic import InternalServerError, RateLimitError
+from anthropic.types.message_create_params import MessageCreateParamsNonStreaming
+from anthropic.types.messages.batch_create_params import Request
 from dotenv import load_dotenv
-from pydantic import BaseModel, Field
+import httpx
+import anthropic_client
+from llm_cache import response_cache
+from rate_limiter import AsyncRateLimiter
+
+logger = logging.getLogger(__name__)
 
 # Load .env file from the backend directory (works in both local and Docker)
 env_path = Path(__file__).parent / '.env'
@@ -21,66 +35,312 @@ if not ANTHROPIC_API_KEY:
 if not TAVILY_API_KEY:
     raise ValueError("TAVILY_API_KEY environment variable is required")
 
-claude_client = Anthropic(api_key=ANTHROPIC_API_KEY)
-tavily_client = TavilyClient(api_key=TAVILY_API_KEY)
+# Tavily's search endpoint is called over one pooled keep-alive client (HTTP/2 when
+# available). tavily-python's TavilyClient opens a new connection for every search.
+TAVILY_SEARCH_URL = "https://api.tavily.com/search"
+TAVILY_MAX_CONNECTIONS = 20
+
+# Searches start at basic depth, which costs one credit instead of two and answers
+# faster; they are repeated at advanced depth only when fewer than 3 results clear
+# MIN_SOURCE_SCORE, the relevance threshold a source needs to reach the scoring step
+TAVILY_BASIC_MAX_RESULTS = 5
+TAVILY_ADVANCED_MAX_RESULTS = 10
+MIN_SOURCE_SCORE = 0.5
+_tavily_limits = httpx.Limits(max_connections=TAVILY_MAX_CONNECTIONS, max_keepalive_connections=TAVILY_MAX_CONNECTIONS)
+tavily_http = httpx.Client(http2=anthropic_client.HTTP2, timeout=100.0, limits=_tavily_limits)
+# Used by the async pipeline, so searches don't tie up a worker thread each
+tavily_async_http = httpx.AsyncClient(http2=anthropic_client.HTTP2, timeout=100.0, limits=_tavily_limits)
 
 # Use Claude Haiku for fast, cost-effective fact-checking
 CLAUDE_MODEL = "claude-3-haiku-20240307"
 
+# Retry policy for rate-limited (429) and overloaded (5xx) async calls
+MAX_RATE_LIMIT_RETRIES = 5
+RATE_LIMIT_BACKOFF_SECONDS = 1.0
+
+# Client-side limits for the async pipeline, so concurrent checks queue up here
+# instead of running into 429s. Defaults match Anthropic's tier 1 limits for Haiku
+# and Tavily's default request rate.
+CLAUDE_RPM = int(os.getenv("CLAUDE_RPM", "50"))
+CLAUDE_INPUT_TPM = int(os.getenv("CLAUDE_INPUT_TPM", "50000"))
+TAVILY_RPM = int(os.getenv("TAVILY_RPM", "100"))
+claude_request_limiter = AsyncRateLimiter(CLAUDE_RPM)
+claude_token_limiter = AsyncRateLimiter(CLAUDE_INPUT_TPM)
+tavily_request_limiter = AsyncRateLimiter(TAVILY_RPM)
+
+# A search on the raw argument runs while the core claim is being extracted. Its
+# results are kept when at least this share of the claim's words were in the query.
+SPECULATIVE_QUERY_MAX_CHARS = 400
+SPECULATIVE_QUERY_MIN_OVERLAP = 0.6
+_QUERY_WORD_RE = re.compile(r"[a-z0-9]{4,}")
+
+# Scoring prompts are sized to about this many input tokens: sources get as much of
+# their content as fits, but at least MIN_SOURCE_CONTENT_CHARS each. Token counts are
+# estimated locally by count_tokens, without a round trip to the counting endpoint.
+SCORING_PROMPT_TOKEN_TARGET = 2000
+MIN_SOURCE_CONTENT_CHARS = 500
+MAX_SOURCE_CONTENT_CHARS = 1500
+_TOKEN_PIECE_RE = re.compile(r"[A-Za-z]{1,6}|\d{1,3}|[^\sA-Za-z\d]")
+
+# Local pre-filter: short opinion-only arguments get the no-claims verdict without any API call.
+# Only words that never carry a claim by themselves; "wrong", "agree", "love" etc. often do
+NON_FACTUAL_MAX_WORDS = 8
+_FACTUAL_MARKER_RE = re.compile(r"[\d%$]")
+_OPINION_WORD_RE = re.compile(
+    r"\b(sucks?|stupid|dumb|idiots?|lol|lmao|trash|garbage|ridiculous|nonsense|whatever"
+    r"|boring|cringe)\b",
+    re.IGNORECASE
+)
 
-class ValidityVerdict(BaseModel):
-    """Pydantic model for fact-checking verdict."""
-    is_relevant: bool = Field(..., description="Whether the argument is relevant to the debate topic")
-    validity_score: int = Field(..., ge=1, le=5, description="Validity score from 1-5 stars (only meaningful if is_relevant=True)")
-    reasoning: str = Field(..., description="Explanation for the validity score")
-    key_urls: List[str] = Field(..., description="Top 3 most relevant source URLs")
-    source_count: int = Field(..., description="Number of sources found")
+# Parsing of free-text scoring responses (only used if Claude answers without the tool)
+_JSON_DECODER = json.JSONDecoder()
+_IS_RELEVANT_RE = re.compile(r'"is_relevant"\s*:\s*(true|false)', re.IGNORECASE)
+_VALIDITY_RE = re.compile(r'"validity_score"\s*:\s*(\d+)')
+_REASONING_RE = re.compile(r'"reasoning"\s*:\s*"((?:\\.|[^\\])*?)"\s*[,}]', re.DOTALL)
+_URLS_RE = re.compile(r'"key_urls"\s*:\s*\[(.*?)\]', re.DOTALL)
+_QUOTED_STRING_RE = re.compile(r'"((?:[^"\\]|\\.)*)"')
 
+# Verdicts for an identical argument are reused for 30 days
+VERDICT_CACHE_TTL = 30 * 86400
 
-def extract_core_claim(title: str, content: str, debate_question: str) -> str:
+# Each step's output is also cached on its own inputs, so arguments that reduce to
+# the same claim (or are retried after a later step failed) skip the repeated calls.
+# Search results go stale sooner than Claude's reading of a fixed prompt.
+CLAIM_CACHE_TTL = 86400
+SEARCH_CACHE_TTL = 3600
+SCORE_CACHE_TTL = 86400
+
+# Default number of arguments verify_arguments_async checks at once, to stay inside
+# the Anthropic and Tavily rate limits
+MAX_CONCURRENT_CHECKS = 5
+
+# Tavily requests currently in flight on the event loop, by normalized query
+_inflight_searches: Dict[str, asyncio.Task] = {}
+_SEARCH_KEY_RE = re.compile(r"[^a-z0-9]+")
+
+# Worker threads that run verify_arguments_batch's per-claim Tavily searches in parallel
+_search_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="tavily-search")
+
+
+@dataclass(slots=True)
+class ValidityVerdict:
     """
-    STEP 1: Extract the core verifiable claim from an argument.
+    Fact-checking verdict.
     
-    Uses Claude to strip away rhetoric and focus on factual claims that can be researched.
-    
-    Args:
-        title: Argument title
-        content: Argument content
-        debate_question: The debate topic/question this argument is responding to
-    
-    Returns:
-        Extracted claim in 2 sentences or less
+    A plain dataclass: every verdict is built from fields _normalize_verdict has already
+    checked, so there is nothing for per-construction validation to do. The API
+    responses use the pydantic ValidityVerdictResponse in models.py.
     """
-    prompt = f"""You are analyzing an argument in a debate about: {debate_question}
+    is_relevant: bool  # Whether the argument is relevant to the debate topic
+    validity_score: int  # 1-5 stars (only meaningful if is_relevant=True)
+    reasoning: str  # Explanation for the validity score
+    key_urls: List[str]  # Top 3 most relevant source URLs
+    source_count: int  # Number of sources found
 
-Extract the core verifiable claim from this argument. Focus on factual statements that can be researched and verified, not opinions or rhetoric.
+    def to_json(self) -> str:
+        return orjson.dumps(self).decode()
 
-Title: {title}
-Content: {content}
+    @classmethod
+    def from_json(cls, data: str) -> "ValidityVerdict":
+        """Rebuild a verdict serialized with to_json (raises ValueError if it doesn't fit)."""
+        try:
+            return cls(**orjson.loads(data))
+        except TypeError as e:
+            raise ValueError(f"Not a serialized verdict: {e}")
+
+
+# Static instructions for the two Claude steps. Each is sent as its own content block
+# marked for prompt caching, ahead of the per-argument text.
+EXTRACT_INSTRUCTIONS = """You are analyzing an argument in a debate. The debate topic and the argument follow these instructions.
+
+Extract the core verifiable claim from this argument. Focus on factual statements that can be researched and verified, not opinions or rhetoric.
 
 Return ONLY the core factual claim in 2 sentences or less. Remove all opinion, rhetoric, and emotional language. Focus on what can be factually verified related to the debate topic.
 
 If the argument contains no verifiable factual claims (only opinions, insults, or emotional statements), return "NO VERIFIABLE FACTUAL CLAIMS"."""
 
-    try:
-        message = claude_client.messages.create(
-            model=CLAUDE_MODEL,
-            max_tokens=200,
-            messages=[
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ]
-        )
+ANALYSIS_INSTRUCTIONS = """You are fact-checking an argument in a debate. The debate topic, the argument's core claim and the search results for it follow these instructions.
+
+FIRST, determine if this argument is RELEVANT to the debate topic.
+
+An argument is IRRELEVANT if it:
+- Contains no factual claims (only opinions like "this sucks" or "you guys are wrong")
+- Makes claims unrelated to the debate topic
+- Is just insults, rhetoric, or emotional statements
+
+If IRRELEVANT:
+- Set is_relevant to false
+- Set validity_score to 1
+- Provide reasoning explaining why it's irrelevant
+
+If RELEVANT:
+- Set is_relevant to true
+- Verify whether the factual claims supporting their position are true
+- Score based on evidence quality (1-5 stars)
+
+If RELEVANT, assign a validity score from 1-5 stars based on these criteria:
+
+- 5 stars: Fully supported by multiple high-quality sources (average relevance score > 0.8, at least 2-3 sources)
+- 4 stars: Mostly supported with good sources (average relevance score > 0.6, at least 2 sources)
+- 3 stars: Partially supported, mixed evidence (1-2 sources with moderate scores)
+- 2 stars: Limited support from few sources (only 1 source or low average score)
+- 1 star: No credible evidence, contradicted by sources
+
+IMPORTANT: The search results have already been filtered for quality (relevance score > 0.5). 
+If very few sources pass this threshold, the validity score should be lower.
+
+Consider BOTH the number of sources AND their quality (relevance scores).
+
+Return the verdict by calling the emit_verdict tool: reasoning in 2-3 sentences explaining the score, and at most 3 key URLs taken from the search results."""
+
+# Structured output: Claude is forced to call this tool, so the verdict arrives as parsed JSON
+VERDICT_TOOL = {
+    "name": "emit_verdict",
+    "description": "Record the fact-checking verdict for the argument.",
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "is_relevant": {"type": "boolean"},
+            "validity_score": {"type": "integer", "minimum": 1, "maximum": 5},
+            "reasoning": {"type": "string"},
+            "key_urls": {"type": "array", "items": {"type": "string"}, "maxItems": 3}
+        },
+        "required": ["is_relevant", "validity_score", "reasoning", "key_urls"]
+    }
+}
+VERDICT_TOOL_CHOICE = {"type": "tool", "name": VERDICT_TOOL["name"]}
+
+# Claim extraction and scoring in one call, used when search results for the raw
+# argument are already cached (see _run_fused_pipeline_async)
+FUSED_INSTRUCTIONS = """You are fact-checking an argument in a debate. The debate topic, the argument and the search results for it follow these instructions.
+
+Start by extracting the core verifiable claim from the argument: the factual statements that can be researched and verified, in 2 sentences or less, with all opinion, rhetoric and emotional language removed. If the argument contains no verifiable factual claims, the claim is "NO VERIFIABLE FACTUAL CLAIMS".
+
+Then judge that claim against the search results.
+
+""" + ANALYSIS_INSTRUCTIONS.split("\n\n", 1)[1] + """ Also pass the extracted claim as core_claim."""
+
+FUSED_TOOL = {
+    **VERDICT_TOOL,
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "core_claim": {"type": "string"},
+            **VERDICT_TOOL["input_schema"]["properties"]
+        },
+        "required": ["core_claim", *VERDICT_TOOL["input_schema"]["required"]]
+    }
+}
+
+
+def _cached_step(step: str, ttl: int, dumps: Callable, loads: Callable):
+    """
+    Memoize a pipeline step in response_cache, keyed by the step name and its arguments.
+    
+    Works on both plain and async functions; the sync and async versions of a step
+    share entries when given the same step name. Exceptions are not cached. The
+    wrapper's .cached(*args) looks an entry up without running the step.
+    """
+    def decorator(func):
+        def cache_key(args, kwargs) -> str:
+            return response_cache.make_key(CLAUDE_MODEL, f"{step}\x00" + orjson.dumps([args, kwargs]).decode())
         
-        claim = message.content[0].text.strip()
-        return claim
+        def load(cached: Optional[str]):
+            if cached is None:
+                return None
+            try:
+                return loads(cached)
+            except ValueError:
+                return None
         
-    except Exception as e:
-        raise RuntimeError(f"Failed to extract core claim: {str(e)}")
+        def cached(*args, **kwargs):
+            """The cached result for these arguments, or None, without running the step."""
+            return load(response_cache.get(cache_key(args, kwargs)))
+        
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                key = cache_key(args, kwargs)
+                result = load(response_cache.get(key))
+                if result is None:
+                    result = await func(*args, **kwargs)
+                    response_cache.set(key, dumps(result), ttl=ttl)
+                else:
+                    logger.debug(f"{step} cache hit")
+                return result
+            async_wrapper.cached = cached
+            return async_wrapper
+        
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = cache_key(args, kwargs)
+            result = load(response_cache.get(key))
+            if result is None:
+                result = func(*args, **kwargs)
+                response_cache.set(key, dumps(result), ttl=ttl)
+            else:
+                logger.debug(f"{step} cache hit")
+            return result
+        wrapper.cached = cached
+        return wrapper
+    return decorator
+
+
+_cache_claim = _cached_step("claim", CLAIM_CACHE_TTL, dumps=str, loads=str)
+_cache_search = _cached_step("search", SEARCH_CACHE_TTL, dumps=lambda results: orjson.dumps(results).decode(), loads=orjson.loads)
+_cache_score = _cached_step("score", SCORE_CACHE_TTL, dumps=ValidityVerdict.to_json, loads=ValidityVerdict.from_json)
+
+
+def _message_content(instructions: str, prompt: str) -> List[Dict]:
+    """User message content: the cacheable instructions followed by the per-argument text."""
+    return [
+        {"type": "text", "text": instructions, "cache_control": {"type": "ephemeral"}},
+        {"type": "text", "text": prompt}
+    ]
+
 
+def _build_extract_prompt(title: str, content: str, debate_question: str) -> List[Dict]:
+    """Build the claim-extraction message content (shared by the single and batch paths)."""
+    return _message_content(EXTRACT_INSTRUCTIONS, f"""DEBATE TOPIC: {debate_question}
+
+Title: {title}
+Content: {content}""")
+
+
+def _tavily_request_body(query: str, advanced: bool = False) -> bytes:
+    return orjson.dumps({
+        "api_key": TAVILY_API_KEY,
+        "query": query,
+        "max_results": TAVILY_ADVANCED_MAX_RESULTS if advanced else TAVILY_BASIC_MAX_RESULTS,
+        "search_depth": "advanced" if advanced else "basic"
+    })
+
+
+def _has_enough_sources(results: List[Dict]) -> bool:
+    """Whether a search already yields the 3 quality sources the scoring step can use."""
+    return sum(1 for r in results if r.get('score', 0) > MIN_SOURCE_SCORE) >= 3
+
+
+def _merge_results(advanced_results: List[Dict], basic_results: List[Dict]) -> List[Dict]:
+    """Advanced results plus any basic result whose URL they don't already include."""
+    urls = {r.get('url') for r in advanced_results}
+    return advanced_results + [r for r in basic_results if r.get('url') not in urls]
+
+
+def _tavily_results(http_response: httpx.Response) -> List[Dict]:
+    """Search results from a Tavily response (raises on an HTTP error status)."""
+    http_response.raise_for_status()
+    response = orjson.loads(http_response.content)
+    
+    # Tavily returns results directly or in a 'results' key
+    if isinstance(response, dict):
+        return response.get('results', [])
+    elif isinstance(response, list):
+        return response
+    return []
 
+
+@_cache_search
 def search_for_evidence(claim: str) -> List[Dict]:
     """
     STEP 2: Search for evidence using Tavily API.
@@ -92,71 +352,161 @@ def search_for_evidence(claim: str) -> List[Dict]:
         List of search results from Tavily
     """
     try:
-        response = tavily_client.search(
-            query=claim,
-            max_results=10,
-            search_depth="advanced"
-        )
-        
-        # Tavily returns results directly or in a 'results' key
-        if isinstance(response, dict):
-            results = response.get('results', [])
-        elif isinstance(response, list):
-            results = response
-        else:
-            results = []
-        
-        return results
-        
+        # A cheap basic search first; the advanced one only if it falls short
+        results = _tavily_results(tavily_http.post(
+            TAVILY_SEARCH_URL,
+            content=_tavily_request_body(claim),
+            headers={"Content-Type": "application/json"}
+        ))
+        if _has_enough_sources(results):
+            return results
+        return _merge_results(_tavily_results(tavily_http.post(
+            TAVILY_SEARCH_URL,
+            content=_tavily_request_body(claim, advanced=True),
+            headers={"Content-Type": "application/json"}
+        )), results)
     except Exception as e:
         raise RuntimeError(f"Failed to search for evidence: {str(e)}")
 
 
-def format_tavily_results(results: List[Dict]) -> str:
+def _search_key(query: str) -> str:
+    """Normalize a search query so trivially different phrasings share one search."""
+    return " ".join(_SEARCH_KEY_RE.sub(" ", query.lower()).split())
+
+
+async def _post_search_async(claim: str) -> List[Dict]:
+    await tavily_request_limiter.acquire()
+    try:
+        results = _tavily_results(await tavily_async_http.post(
+            TAVILY_SEARCH_URL,
+            content=_tavily_request_body(claim),
+            headers={"Content-Type": "application/json"}
+        ))
+        if _has_enough_sources(results):
+            return results
+        await tavily_request_limiter.acquire()
+        return _merge_results(_tavily_results(await tavily_async_http.post(
+            TAVILY_SEARCH_URL,
+            content=_tavily_request_body(claim, advanced=True),
+            headers={"Content-Type": "application/json"}
+        )), results)
+    except Exception as e:
+        raise RuntimeError(f"Failed to search for evidence: {str(e)}")
+
+
+def _finish_inflight_search(key: str, task: asyncio.Task):
+    _inflight_searches.pop(key, None)
+    # Retrieve the outcome so a search nobody awaited never logs an unretrieved exception
+    task.cancelled() or task.exception()
+
+
+@_cache_search
+async def search_for_evidence_async(claim: str) -> List[Dict]:
+    """
+    Async version of search_for_evidence.
+    
+    Concurrent searches for the same normalized query share a single Tavily request.
+    The request runs as its own task, so a caller that is cancelled (e.g. a discarded
+    speculative search) doesn't cancel it for the others.
+    """
+    key = _search_key(claim)
+    task = _inflight_searches.get(key)
+    if task is None:
+        task = asyncio.ensure_future(_post_search_async(claim))
+        _inflight_searches[key] = task
+        task.add_done_callback(functools.partial(_finish_inflight_search, key))
+    return await asyncio.shield(task)
+
+
+def _speculative_query(title: str, content: str) -> str:
+    """Search query built from the raw argument, usable before the core claim is known."""
+    return f"{title}. {content}"[:SPECULATIVE_QUERY_MAX_CHARS]
+
+
+def _query_covers_claim(query: str, claim: str) -> bool:
+    """Whether searching query is a good stand-in for searching the extracted claim."""
+    claim_words = set(_QUERY_WORD_RE.findall(claim.lower()))
+    if not claim_words:
+        return True
+    query_words = set(_QUERY_WORD_RE.findall(query.lower()))
+    return len(claim_words & query_words) / len(claim_words) >= SPECULATIVE_QUERY_MIN_OVERLAP
+
+
+def _source_content(result: Dict) -> str:
+    """A search result's content, or a marker saying it has none."""
+    return result.get('content') or 'No content'
+
+
+def format_tavily_results(results: List[Dict], content_chars: Optional[List[int]] = None) -> str:
     """
     Format Tavily search results for Claude analysis.
     
     Args:
         results: List of Tavily search result dictionaries
+        content_chars: Characters of content to keep per result (default 500 each)
     
     Returns:
         Formatted string with results
     """
     if not results:
         return "No sources found."
+    if content_chars is None:
+        content_chars = [500] * len(results)
     
-    formatted = []
-    for i, result in enumerate(results, 1):
-        title = result.get('title', 'No title')
-        url = result.get('url', 'No URL')
-        score = result.get('score', 0)
-        content = result.get('content', 'No content')[:500]  # Limit content length
-        
-        formatted.append(f"""
-Source {i}:
-Title: {title}
-URL: {url}
-Relevance Score: {score:.3f}
-Content: {content}...
-""")
-    
-    return "\n".join(formatted)
+    return "\n".join(
+        f"\nSource {i}:\n"
+        f"Title: {result.get('title', 'No title')}\n"
+        f"URL: {result.get('url', 'No URL')}\n"
+        f"Relevance Score: {result.get('score', 0):.3f}\n"
+        f"Content: {_source_content(result)[:chars]}...\n"
+        for i, (result, chars) in enumerate(zip(results, content_chars), 1)
+    )
 
 
-def analyze_and_score(original_claim: str, tavily_results: List[Dict], debate_question: str) -> ValidityVerdict:
+@functools.lru_cache(maxsize=4096)
+def count_tokens(text: str) -> int:
     """
-    STEP 3: Analyze evidence and assign validity score.
-    
-    Uses Claude to analyze the quality and quantity of evidence and assign a 1-5 star score.
+    Estimate the Claude token count of text locally.
     
-    Args:
-        original_claim: The extracted core claim
-        tavily_results: List of Tavily search results
+    Approximates BPE splitting (short letter runs, digit groups, single punctuation marks)
+    with one C-level regex pass; cached because the instruction blocks recur on every call.
+    """
+    return len(_TOKEN_PIECE_RE.findall(text))
+
+
+def _source_content_chars(results: List[Dict], token_budget: int) -> List[int]:
+    """
+    How much of each source's content fits when they share token_budget evenly,
+    never less than the usual 500 characters nor more than MAX_SOURCE_CONTENT_CHARS.
+    """
+    if not results:
+        return []
+    per_source = token_budget // len(results)
+    content_chars = []
+    for result in results:
+        # Budget the same text format_tavily_results shows, including the empty marker
+        content = _source_content(result)
+        tokens = count_tokens(content)
+        if tokens == 0:
+            # Whitespace only: nothing worth showing
+            chars = 0
+        elif tokens <= per_source:
+            chars = len(content)
+        else:
+            chars = max(MIN_SOURCE_CONTENT_CHARS, len(content) * per_source // tokens)
+        content_chars.append(min(chars, MAX_SOURCE_CONTENT_CHARS))
+    return content_chars
+
+
+def _evidence_section(tavily_results: List[Dict], prompt_tokens: int) -> str:
+    """
+    The search results and their statistics, as shown to Claude for scoring.
     
-    Returns:
-        ValidityVerdict with score, reasoning, and key URLs
+    Source content is cut so the whole prompt stays near SCORING_PROMPT_TOKEN_TARGET,
+    given the prompt_tokens already used by the rest of it.
     """
-    formatted_results = format_tavily_results(tavily_results)
+    content_chars = _source_content_chars(tavily_results, SCORING_PROMPT_TOKEN_TARGET - prompt_tokens)
+    formatted_results = format_tavily_results(tavily_results, content_chars)
     source_count = len(tavily_results)
     
     # Calculate average relevance score
@@ -165,218 +515,590 @@ def analyze_and_score(original_claim: str, tavily_results: List[Dict], debate_qu
         scores = [r.get('score', 0) for r in tavily_results]
         avg_score = sum(scores) / len(scores) if scores else 0.0
     
-    prompt = f"""You are fact-checking an argument in a debate about: {debate_question}
+    return f"""SEARCH RESULTS (pre-filtered for high-quality sources with relevance score > 0.5):
+{formatted_results}
 
-FIRST, determine if this argument is RELEVANT to the debate topic.
+Average relevance score of sources: {avg_score:.3f}
+Number of high-quality sources found: {source_count}"""
 
-An argument is IRRELEVANT if it:
-- Contains no factual claims (only opinions like "this sucks" or "you guys are wrong")
-- Makes claims unrelated to the debate topic
-- Is just insults, rhetoric, or emotional statements
 
-If IRRELEVANT:
-- Set is_relevant to false
-- Set validity_score to 1
-- Provide reasoning explaining why it's irrelevant
-
-If RELEVANT:
-- Set is_relevant to true
-- Verify whether the factual claims supporting their position are true
-- Score based on evidence quality (1-5 stars)
+def _build_analysis_prompt(original_claim: str, tavily_results: List[Dict], debate_question: str) -> List[Dict]:
+    """Build the evidence-scoring message content (shared by the single and batch paths)."""
+    prompt_tokens = count_tokens(ANALYSIS_INSTRUCTIONS) + count_tokens(debate_question) + count_tokens(original_claim)
+    return _message_content(ANALYSIS_INSTRUCTIONS, f"""DEBATE TOPIC: {debate_question}
 
 ORIGINAL CLAIM:
 {original_claim}
 
-SEARCH RESULTS (pre-filtered for high-quality sources with relevance score > 0.5):
-{formatted_results}
+{_evidence_section(tavily_results, prompt_tokens)}""")
 
-If RELEVANT, assign a validity score from 1-5 stars based on these criteria:
 
-- 5 stars: Fully supported by multiple high-quality sources (average relevance score > 0.8, at least 2-3 sources)
-- 4 stars: Mostly supported with good sources (average relevance score > 0.6, at least 2 sources)
-- 3 stars: Partially supported, mixed evidence (1-2 sources with moderate scores)
-- 2 stars: Limited support from few sources (only 1 source or low average score)
-- 1 star: No credible evidence, contradicted by sources
+def _build_fused_prompt(title: str, content: str, debate_question: str, tavily_results: List[Dict]) -> List[Dict]:
+    """Build the message content for extracting and scoring the claim in one call."""
+    prompt_tokens = (
+        count_tokens(FUSED_INSTRUCTIONS) + count_tokens(debate_question)
+        + count_tokens(title) + count_tokens(content)
+    )
+    return _message_content(FUSED_INSTRUCTIONS, f"""DEBATE TOPIC: {debate_question}
 
-IMPORTANT: These sources have already been filtered for quality (relevance score > 0.5). 
-If very few sources pass this threshold, the validity score should be lower.
+Title: {title}
+Content: {content}
 
-Consider BOTH the number of sources AND their quality (relevance scores).
+{_evidence_section(tavily_results, prompt_tokens)}""")
 
-Average relevance score of sources: {avg_score:.3f}
-Number of high-quality sources found: {source_count}
-
-Return a JSON object with this exact structure. Make sure all strings are properly escaped:
-{{
-    "is_relevant": <boolean>,
-    "validity_score": <1-5>,
-    "reasoning": "<2-3 sentences explaining the score. Escape any quotes with backslash.>",
-    "key_urls": ["<url1>", "<url2>", "<url3>"]
-}}
-
-IMPORTANT: 
-- Return ONLY valid JSON, no markdown formatting or extra text
-- Escape all quotes in the reasoning field with backslashes
-- Include exactly 3 URLs or fewer from the search results above
-- Ensure all URLs are properly quoted and escaped"""
 
+def _message_text(content: List) -> str:
+    """Text of the first text block in a response's content."""
+    for block in content:
+        if block.type == 'text':
+            return block.text.strip()
+    return ""
+
+
+def _verdict_from_content(content: List, source_count: int) -> ValidityVerdict:
+    """
+    Read the emit_verdict tool input from a scoring response.
+    
+    Falls back to parsing JSON out of a text block in the unlikely case the model
+    answered without the tool.
+    """
+    for block in content:
+        if block.type == 'tool_use':
+            return _normalize_verdict(dict(block.input), source_count)
+    return _parse_verdict(_message_text(content), source_count)
+
+
+def _fused_verdict_from_content(content: List, source_count: int) -> tuple:
+    """Read the (core_claim, verdict) pair from a fused extraction-and-scoring response."""
+    for block in content:
+        if block.type == 'tool_use':
+            result = dict(block.input)
+            return str(result.get('core_claim', '')).strip(), _normalize_verdict(result, source_count)
+    raise ValueError("Claude did not call the verdict tool")
+
+
+def _salvage_verdict_fields(json_text: str) -> Dict:
+    """
+    Extract the verdict fields one by one from malformed JSON (e.g. unescaped quotes
+    in the reasoning), using defaults for anything that can't be found.
+    """
+    # Extract is_relevant (boolean)
+    is_relevant_match = _IS_RELEVANT_RE.search(json_text)
+    is_relevant = is_relevant_match.group(1).lower() == 'true' if is_relevant_match else True  # Default to True if not found
+    
+    validity_match = _VALIDITY_RE.search(json_text)
+    
+    validity_score = int(validity_match.group(1)) if validity_match else 3
+    if validity_score < 1 or validity_score > 5:
+        validity_score = 3
+    
+    # Extract reasoning - the value runs to the first quote followed by , or }, so
+    # unescaped quotes inside it are kept
+    reasoning = "Unable to parse reasoning from response"
+    reasoning_match = _REASONING_RE.search(json_text)
+    if reasoning_match:
+        # Unescape common escape sequences
+        reasoning = reasoning_match.group(1).replace('\\"', '"').replace('\\n', '\n').replace('\\t', '\t').replace('\\\\', '\\')
+    
+    # Extract URLs from the array
+    urls_match = _URLS_RE.search(json_text)
+    key_urls = []
+    if urls_match:
+        # Extract URLs, handling escaped quotes
+        url_matches = _QUOTED_STRING_RE.findall(urls_match.group(1))
+        key_urls = [url.replace('\\"', '"').replace('\\\\', '\\') for url in url_matches if url][:3]
+    
+    return {
+        'is_relevant': is_relevant,
+        'validity_score': validity_score,
+        'reasoning': reasoning,
+        'key_urls': key_urls
+    }
+
+
+def _parse_verdict(response_text: str, source_count: int) -> ValidityVerdict:
+    """
+    Turn a free-text scoring response into a ValidityVerdict.
+    
+    The first JSON object in the text is decoded in one pass (markdown fences and
+    surrounding prose are skipped); malformed JSON falls back to field-by-field extraction.
+    """
+    start_idx = response_text.find('{')
+    json_text = response_text[start_idx:] if start_idx != -1 else response_text
     try:
-        message = claude_client.messages.create(
-            model=CLAUDE_MODEL,
-            max_tokens=1000,
-            messages=[
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ]
-        )
-        
-        response_text = message.content[0].text.strip()
-        
-        # Extract JSON from response - handle multiple formats
-        json_text = None
-        
-        # Try to find JSON in code blocks first
-        json_block_match = re.search(r'```(?:json)?\s*(\{.*?\})\s*```', response_text, re.DOTALL)
-        if json_block_match:
-            json_text = json_block_match.group(1)
-        else:
-            # Try to find JSON object by matching braces
-            # Find the first { and match to the last }
-            start_idx = response_text.find('{')
-            if start_idx != -1:
-                brace_count = 0
-                end_idx = start_idx
-                for i in range(start_idx, len(response_text)):
-                    if response_text[i] == '{':
-                        brace_count += 1
-                    elif response_text[i] == '}':
-                        brace_count -= 1
-                        if brace_count == 0:
-                            end_idx = i + 1
-                            break
-                if end_idx > start_idx:
-                    json_text = response_text[start_idx:end_idx]
-            else:
-                # Fallback: use entire response
-                json_text = response_text
-        
-        # Clean up the JSON text
-        if json_text:
-            json_text = json_text.strip()
-        
-        # Parse JSON with error handling
+        result, _ = _JSON_DECODER.raw_decode(json_text)
+    except ValueError:
         result = None
+    if not isinstance(result, dict):
+        result = _salvage_verdict_fields(json_text)
+    
+    return _normalize_verdict(result, source_count)
+
+
+def _normalize_verdict(result: Dict, source_count: int) -> ValidityVerdict:
+    """Clamp and clean the verdict fields Claude returned and build a ValidityVerdict."""
+    is_relevant = result.get('is_relevant', True)
+    if not isinstance(is_relevant, bool):
+        is_relevant = str(is_relevant).lower() in ('true', '1', 'yes')
+    
+    validity_score = int(result.get('validity_score', 3))
+    if validity_score < 1 or validity_score > 5:
+        validity_score = 3  # Default to middle score if invalid
+    
+    # Ensure key_urls is a list and limit to 3
+    key_urls = result.get('key_urls', [])
+    if isinstance(key_urls, str):
+        key_urls = [key_urls]
+    elif not isinstance(key_urls, list):
+        key_urls = []
+    # Filter out empty strings and limit to 3
+    key_urls = [url for url in key_urls if url and isinstance(url, str)][:3]
+    
+    # Clean reasoning text
+    reasoning = result.get('reasoning', 'No reasoning provided')
+    if isinstance(reasoning, str):
+        # Remove any extra quotes or formatting
+        reasoning = reasoning.strip().strip('"').strip("'")
+    else:
+        reasoning = str(reasoning)
+    
+    verdict = ValidityVerdict(
+        is_relevant=is_relevant,
+        validity_score=validity_score,
+        reasoning=reasoning,
+        key_urls=key_urls,
+        source_count=source_count
+    )
+    
+    return verdict
+
+
+def _verdict_cache_key(title: str, content: str, debate_question: str) -> str:
+    """
+    Cache key for the verdict on one argument within one debate. Case, punctuation and
+    whitespace are normalized away, so reformatted resubmissions reuse the verdict.
+    """
+    return response_cache.make_key(
+        CLAUDE_MODEL,
+        f"verdict\x00{_search_key(debate_question)}\x00{_search_key(title)}\x00{_search_key(content)}"
+    )
+
+
+def _get_cached_verdict(cache_key: str) -> Optional[ValidityVerdict]:
+    cached = response_cache.get(cache_key)
+    if cached is None:
+        return None
+    try:
+        return ValidityVerdict.from_json(cached)
+    except ValueError:
+        return None
+
+
+def _cache_verdict(cache_key: str, verdict: ValidityVerdict):
+    response_cache.set(cache_key, verdict.to_json(), ttl=VERDICT_CACHE_TTL)
+
+
+def _has_no_verifiable_claims(claim: str) -> bool:
+    """Whether the extraction step reported that there is nothing to fact-check."""
+    return claim.upper() == "NO VERIFIABLE FACTUAL CLAIMS" or not claim.strip()
+
+
+def _is_likely_non_factual(title: str, content: str) -> bool:
+    """
+    Cheap local check for arguments that are plainly opinion or insult, so they can
+    skip the pipeline entirely.
+    
+    Deliberately strict: the title and the content must each be short, all-lowercase
+    (after the first letter), free of numbers and use an opinion word. Anything that
+    might carry a claim still goes to Claude.
+    """
+    return _is_opinion_only(title) and _is_opinion_only(content)
+
+
+def _is_opinion_only(text: str) -> bool:
+    return (
+        len(text.split()) <= NON_FACTUAL_MAX_WORDS
+        and not _FACTUAL_MARKER_RE.search(text)
+        and not any(c.isupper() for c in text[1:])
+        and _OPINION_WORD_RE.search(text) is not None
+    )
+
+
+def _no_claims_verdict(debate_question: str) -> ValidityVerdict:
+    """Verdict for arguments that contain only opinion or rhetoric."""
+    return ValidityVerdict(
+        is_relevant=False,
+        validity_score=1,
+        reasoning=f"This argument contains no verifiable factual claims related to the debate topic: '{debate_question}'. It consists only of opinions, rhetoric, or emotional statements that cannot be fact-checked.",
+        key_urls=[],
+        source_count=0
+    )
+
+
+def _no_sources_verdict(source_count: int) -> ValidityVerdict:
+    """Verdict for relevant claims where no source clears the quality threshold."""
+    return ValidityVerdict(
+        is_relevant=True,  # Still relevant, just can't verify
+        validity_score=1,
+        reasoning="No high-quality sources found (all sources had relevance score ≤ 0.5). The claim cannot be verified with credible evidence.",
+        key_urls=[],
+        source_count=source_count
+    )
+
+
+def _failed_verdict(error: str) -> ValidityVerdict:
+    """Default verdict when the pipeline could not complete."""
+    return ValidityVerdict(
+        is_relevant=True,  # Default to relevant on error
+        validity_score=1,
+        reasoning=f"Fact-checking failed: {error}",
+        key_urls=[],
+        source_count=0
+    )
+
+
+def _select_top_sources(search_results: List[Dict]) -> List[Dict]:
+    """Keep only high-quality sources (score > 0.5), best first, at most 3."""
+    # Filter and top-3 in one pass, without sorting every result
+    return heapq.nlargest(
+        3,
+        (r for r in search_results if r.get('score', 0) > MIN_SOURCE_SCORE),
+        key=lambda r: r['score']
+    )
+
+
+def _finalize_verdict(verdict: ValidityVerdict, top_sources: List[Dict], all_search_results: List[Dict]) -> ValidityVerdict:
+    """Attach the source URLs and total source count that the pipeline actually used."""
+    # Extract URLs from top sources for key_urls (only high-quality sources with score > 0.5)
+    key_urls = [source.get('url', '') for source in top_sources if source.get('url')]
+    verdict.key_urls = key_urls[:3]  # Ensure max 3 URLs
+    
+    # Update source_count to reflect total sources found (before filtering)
+    verdict.source_count = len(all_search_results)
+    return verdict
+
+
+def _run_message_batch(prompts: Dict[str, List[Dict]], max_tokens: int, poll_interval: float = 5.0, **params) -> Dict[str, List]:
+    """
+    Submit one prompt per custom_id through the Message Batches API and wait for it to finish.
+    
+    Args:
+        prompts: Mapping of custom_id to message content
+        max_tokens: Output token limit for every request in the batch
+        poll_interval: Seconds between status checks
+        **params: Extra message parameters for every request (e.g. tools)
+    
+    Returns:
+        Mapping of custom_id to response content blocks (failed requests are omitted)
+    """
+    if not prompts:
+        return {}
+    
+    batch = anthropic_client.get_sync_client().messages.batches.create(
+        requests=[
+            Request(
+                custom_id=custom_id,
+                params=MessageCreateParamsNonStreaming(
+                    model=CLAUDE_MODEL,
+                    max_tokens=max_tokens,
+                    messages=[{"role": "user", "content": prompt}],
+                    **params
+                )
+            )
+            for custom_id, prompt in prompts.items()
+        ]
+    )
+    
+    while batch.processing_status != "ended":
+        time.sleep(poll_interval)
+        batch = anthropic_client.get_sync_client().messages.batches.retrieve(batch.id)
+    
+    responses = {}
+    for entry in anthropic_client.get_sync_client().messages.batches.results(batch.id):
+        if entry.result.type == "succeeded":
+            responses[entry.custom_id] = entry.result.message.content
+    return responses
+
+
+def verify_arguments_batch(items: List[Dict]) -> Dict[int, ValidityVerdict]:
+    """
+    Run the fact-checking pipeline for many arguments using the Message Batches API.
+    
+    Both Claude steps are submitted as a single batch each (half the token price and no
+    per-request round-trips); the Tavily searches in between run concurrently on the
+    search thread pool. Arguments with a cached verdict are not resubmitted. Intended
+    for offline jobs such as seeding, since a batch can take minutes to complete.
+    
+    Args:
+        items: Dictionaries with 'id', 'title', 'content' and 'debate_question'
+    
+    Returns:
+        Mapping of argument id to ValidityVerdict
+    """
+    by_id = {}
+    verdicts: Dict[int, ValidityVerdict] = {}
+    cache_keys = {}
+    
+    # Arguments plainly without claims, or with a cached verdict, skip both batches.
+    # Pre-filter verdicts are not cached: they cost nothing to redo
+    for item in items:
+        if _is_likely_non_factual(item['title'], item['content']):
+            verdicts[item['id']] = _no_claims_verdict(item['debate_question'])
+            continue
+        cache_key = _verdict_cache_key(item['title'], item['content'], item['debate_question'])
+        cached = _get_cached_verdict(cache_key)
+        if cached is not None:
+            verdicts[item['id']] = cached
+        else:
+            by_id[str(item['id'])] = item
+            cache_keys[item['id']] = cache_key
+    
+    def complete(argument_id: int, verdict: ValidityVerdict):
+        verdicts[argument_id] = verdict
+        _cache_verdict(cache_keys[argument_id], verdict)
+    
+    # Step 1: Extract core claims in one batch
+    claims = {
+        custom_id: _message_text(content)
+        for custom_id, content in _run_message_batch(
+            {
+                custom_id: _build_extract_prompt(item['title'], item['content'], item['debate_question'])
+                for custom_id, item in by_id.items()
+            },
+            max_tokens=200
+        ).items()
+    }
+    
+    # Step 2: Search for evidence for every verifiable claim, several searches at a time
+    searches = {}
+    searches_by_key = {}
+    for custom_id, item in by_id.items():
+        claim = claims.get(custom_id)
+        if claim is None:
+            verdicts[item['id']] = _failed_verdict("claim extraction did not complete")
+            continue
+        if _has_no_verifiable_claims(claim):
+            complete(item['id'], _no_claims_verdict(item['debate_question']))
+            continue
+        # Arguments that reduce to the same claim share one search
+        key = _search_key(claim)
+        if key not in searches_by_key:
+            searches_by_key[key] = _search_executor.submit(search_for_evidence, claim)
+        searches[custom_id] = searches_by_key[key]
+    
+    pending = {}
+    for custom_id, search in searches.items():
+        item = by_id[custom_id]
+        claim = claims[custom_id]
         try:
-            result = json.loads(json_text)
-        except json.JSONDecodeError:
-            # If JSON parsing fails, extract fields manually using regex
-            # This handles cases where Claude returns malformed JSON (e.g., unescaped quotes)
-            
-            # Extract is_relevant (boolean)
-            is_relevant_match = re.search(r'"is_relevant"\s*:\s*(true|false)', json_text, re.IGNORECASE)
-            is_relevant = is_relevant_match.group(1).lower() == 'true' if is_relevant_match else True  # Default to True if not found
-            
-            validity_match = re.search(r'"validity_score"\s*:\s*(\d+)', json_text)
-            
-            validity_score = int(validity_match.group(1)) if validity_match else 3
-            if validity_score < 1 or validity_score > 5:
-                validity_score = 3
-            
-            # Extract reasoning - handle unescaped quotes by finding the field value manually
-            reasoning = "Unable to parse reasoning from response"
-            reasoning_start = json_text.find('"reasoning"')
-            if reasoning_start != -1:
-                # Find the colon after "reasoning"
-                colon_pos = json_text.find(':', reasoning_start)
-                if colon_pos != -1:
-                    # Find the opening quote
-                    quote_start = json_text.find('"', colon_pos)
-                    if quote_start != -1:
-                        # Parse character by character to find the closing quote
-                        # Skip escaped quotes
-                        i = quote_start + 1
-                        reasoning_end = -1
-                        while i < len(json_text):
-                            if json_text[i] == '\\' and i + 1 < len(json_text):
-                                i += 2  # Skip escaped character
-                                continue
-                            elif json_text[i] == '"':
-                                # Check if this is followed by comma or closing brace
-                                j = i + 1
-                                while j < len(json_text) and json_text[j] in ' \t\n\r':
-                                    j += 1
-                                if j < len(json_text) and json_text[j] in ',}':
-                                    reasoning_end = i
-                                    break
-                            i += 1
-                        
-                        if reasoning_end > quote_start:
-                            reasoning = json_text[quote_start + 1:reasoning_end]
-                            # Unescape common escape sequences
-                            reasoning = reasoning.replace('\\"', '"').replace('\\n', '\n').replace('\\t', '\t').replace('\\\\', '\\')
-            
-            # Extract URLs from the array
-            urls_match = re.search(r'"key_urls"\s*:\s*\[(.*?)\]', json_text, re.DOTALL)
-            key_urls = []
-            if urls_match:
-                urls_text = urls_match.group(1)
-                # Extract URLs, handling escaped quotes
-                url_matches = re.findall(r'"((?:[^"\\]|\\.)*)"', urls_text)
-                key_urls = [url.replace('\\"', '"').replace('\\\\', '\\') for url in url_matches if url][:3]
-            
-            result = {
-                'is_relevant': is_relevant,
-                'validity_score': validity_score,
-                'reasoning': reasoning,
-                'key_urls': key_urls
-            }
-        
-        # Validate and create verdict
-        is_relevant = result.get('is_relevant', True)
-        if not isinstance(is_relevant, bool):
-            is_relevant = str(is_relevant).lower() in ('true', '1', 'yes')
-        
-        validity_score = int(result.get('validity_score', 3))
-        if validity_score < 1 or validity_score > 5:
-            validity_score = 3  # Default to middle score if invalid
-        
-        # Ensure key_urls is a list and limit to 3
-        key_urls = result.get('key_urls', [])
-        if isinstance(key_urls, str):
-            key_urls = [key_urls]
-        elif not isinstance(key_urls, list):
-            key_urls = []
-        # Filter out empty strings and limit to 3
-        key_urls = [url for url in key_urls if url and isinstance(url, str)][:3]
-        
-        # Clean reasoning text
-        reasoning = result.get('reasoning', 'No reasoning provided')
-        if isinstance(reasoning, str):
-            # Remove any extra quotes or formatting
-            reasoning = reasoning.strip().strip('"').strip("'")
-        
-        verdict = ValidityVerdict(
-            is_relevant=is_relevant,
-            validity_score=validity_score,
-            reasoning=reasoning,
-            key_urls=key_urls,
-            source_count=source_count
+            all_search_results = search.result()
+        except Exception as e:
+            verdicts[item['id']] = _failed_verdict(str(e))
+            continue
+        top_sources = _select_top_sources(all_search_results)
+        if not top_sources:
+            complete(item['id'], _no_sources_verdict(len(all_search_results)))
+            continue
+        pending[custom_id] = (claim, top_sources, all_search_results)
+    
+    # Step 3: Score all remaining claims in one batch
+    responses = _run_message_batch(
+        {
+            custom_id: _build_analysis_prompt(claim, top_sources, by_id[custom_id]['debate_question'])
+            for custom_id, (claim, top_sources, _) in pending.items()
+        },
+        max_tokens=1000,
+        tools=[VERDICT_TOOL],
+        tool_choice=VERDICT_TOOL_CHOICE
+    )
+    for custom_id, (claim, top_sources, all_search_results) in pending.items():
+        argument_id = by_id[custom_id]['id']
+        content = responses.get(custom_id)
+        if content is None:
+            verdicts[argument_id] = _failed_verdict("scoring did not complete")
+            continue
+        try:
+            verdict = _verdict_from_content(content, len(top_sources))
+        except Exception as e:
+            verdicts[argument_id] = _failed_verdict(str(e))
+            continue
+        complete(argument_id, _finalize_verdict(verdict, top_sources, all_search_results))
+    
+    return verdicts
+
+
+def _estimate_input_tokens(prompt: List[Dict]) -> int:
+    """Input token estimate for rate limiting."""
+    return sum(count_tokens(block["text"]) for block in prompt)
+
+
+async def _create_message_async(prompt: List[Dict], max_tokens: int, **params) -> List:
+    """
+    Call Claude asynchronously within the client-side rate limits, backing off
+    exponentially on rate-limit and server errors. Returns the content blocks.
+    
+    Retries happen only here (the SDK's own retries are switched off for these calls).
+    Every attempt takes a request slot, but the input tokens are taken once per call
+    and given back if the call fails, since rejected requests don't use the quota.
+    """
+    estimated_tokens = _estimate_input_tokens(prompt)
+    client = anthropic_client.get_async_client().with_options(max_retries=0)
+    await claude_token_limiter.acquire(estimated_tokens)
+    delay = RATE_LIMIT_BACKOFF_SECONDS
+    for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+        await claude_request_limiter.acquire()
+        try:
+            message = await client.messages.create(
+                model=CLAUDE_MODEL,
+                max_tokens=max_tokens,
+                messages=[
+                    {
+                        "role": "user",
+                        "content": prompt
+                    }
+                ],
+                **params
+            )
+        except (RateLimitError, InternalServerError):
+            if attempt == MAX_RATE_LIMIT_RETRIES:
+                claude_token_limiter.record(-estimated_tokens)
+                raise
+            await asyncio.sleep(delay)
+            delay *= 2
+        except Exception:
+            claude_token_limiter.record(-estimated_tokens)
+            raise
+        else:
+            # Correct the token bucket with the real count (includes the tool definition)
+            claude_token_limiter.record(message.usage.input_tokens - estimated_tokens)
+            return message.content
+
+
+@_cache_claim
+async def extract_core_claim_async(title: str, content: str, debate_question: str) -> str:
+    """
+    STEP 1: Extract the core verifiable claim from an argument.
+    
+    Uses Claude to strip away rhetoric and focus on factual claims that can be researched.
+    
+    Args:
+        title: Argument title
+        content: Argument content
+        debate_question: The debate topic/question this argument is responding to
+    
+    Returns:
+        Extracted claim in 2 sentences or less
+    """
+    try:
+        return _message_text(
+            await _create_message_async(
+                _build_extract_prompt(title, content, debate_question),
+                max_tokens=200
+            )
         )
-        
-        return verdict
-        
-    except json.JSONDecodeError as e:
-        raise ValueError(f"Failed to parse JSON from Claude response: {e}")
+    except Exception as e:
+        raise RuntimeError(f"Failed to extract core claim: {str(e)}")
+
+
+@_cache_score
+async def analyze_and_score_async(original_claim: str, tavily_results: List[Dict], debate_question: str) -> ValidityVerdict:
+    """
+    STEP 3: Analyze evidence and assign validity score.
+    
+    Uses Claude to analyze the quality and quantity of evidence and assign a 1-5 star score.
+    
+    Args:
+        original_claim: The extracted core claim
+        tavily_results: List of Tavily search results
+    
+    Returns:
+        ValidityVerdict with score, reasoning, and key URLs
+    """
+    try:
+        content = await _create_message_async(
+            _build_analysis_prompt(original_claim, tavily_results, debate_question),
+            max_tokens=1000,
+            tools=[VERDICT_TOOL],
+            tool_choice=VERDICT_TOOL_CHOICE
+        )
+        return _verdict_from_content(content, len(tavily_results))
     except Exception as e:
         raise RuntimeError(f"Failed to analyze and score: {str(e)}")
 
 
-def verify_argument(title: str, content: str, debate_question: str) -> ValidityVerdict:
+async def _run_fused_pipeline_async(title: str, content: str, debate_question: str, search_results: List[Dict], top_sources: List[Dict]) -> ValidityVerdict:
+    """Extract and score the claim in one Claude call against already available search results."""
+    response_content = await _create_message_async(
+        _build_fused_prompt(title, content, debate_question, top_sources),
+        max_tokens=1000,
+        tools=[FUSED_TOOL],
+        tool_choice=VERDICT_TOOL_CHOICE
+    )
+    claim, verdict = _fused_verdict_from_content(response_content, len(top_sources))
+    if _has_no_verifiable_claims(claim):
+        return _no_claims_verdict(debate_question)
+    return _finalize_verdict(verdict, top_sources, search_results)
+
+
+async def _run_pipeline_async(title: str, content: str, debate_question: str) -> ValidityVerdict:
+    """Run the 3 fact-checking steps. Raises if any step fails."""
+    # With the raw argument's search results already cached, one Claude call does both
+    # steps; if that call fails the regular pipeline below still runs
+    query = _speculative_query(title, content)
+    prefetched = search_for_evidence_async.cached(query)
+    if prefetched:
+        top_sources = _select_top_sources(prefetched)
+        if top_sources:
+            try:
+                return await _run_fused_pipeline_async(title, content, debate_question, prefetched, top_sources)
+            except Exception:
+                pass
+    
+    # Search on the raw argument while the claim is being extracted
+    speculative_search = asyncio.create_task(search_for_evidence_async(query))
+    # Retrieve the outcome so a discarded search never logs an unretrieved exception
+    speculative_search.add_done_callback(lambda task: task.cancelled() or task.exception())
+
+    # Step 1: Extract core claim
+    try:
+        claim = await extract_core_claim_async(title, content, debate_question)
+    except Exception:
+        speculative_search.cancel()
+        raise
+
+    if _has_no_verifiable_claims(claim):
+        speculative_search.cancel()
+        return _no_claims_verdict(debate_question)
+
+    # Step 2: Search for evidence
+    all_search_results = None
+    if _query_covers_claim(query, claim):
+        try:
+            all_search_results = await speculative_search
+        except Exception:
+            pass
+    else:
+        speculative_search.cancel()
+    if all_search_results is None:
+        all_search_results = await search_for_evidence_async(claim)
+    top_sources = _select_top_sources(all_search_results)
+    if not top_sources:
+        return _no_sources_verdict(len(all_search_results))
+
+    # Step 3: Analyze and score
+    verdict = await analyze_and_score_async(claim, top_sources, debate_question)
+    return _finalize_verdict(verdict, top_sources, all_search_results)
+
+
+async def verify_argument_async(title: str, content: str, debate_question: str) -> ValidityVerdict:
     """
     Main pipeline function that chains all 3 steps together.
     
+    Claude calls go through AsyncAnthropic and Tavily searches through tavily_async_http,
+    so many arguments can be checked concurrently. A search on the raw argument overlaps
+    the claim extraction, and verdicts are cached by argument text, so resubmitted or
+    duplicate arguments don't re-run the pipeline.
+    
     Args:
         title: Argument title
         content: Argument content
@@ -385,62 +1107,72 @@ def verify_argument(title: str, content: str, debate_question: str) -> ValidityV
     Returns:
         ValidityVerdict with fact-checking results
     """
+    # Pre-filter verdicts are not cached: they cost nothing to redo
+    if _is_likely_non_factual(title, content):
+        return _no_claims_verdict(debate_question)
+    
+    cache_key = _verdict_cache_key(title, content, debate_question)
+    cached = _get_cached_verdict(cache_key)
+    if cached is not None:
+        return cached
+    
     try:
-        # Step 1: Extract core claim
-        claim = extract_core_claim(title, content, debate_question)
-        
-        # If no verifiable claims found, return irrelevant verdict
-        if claim.upper() == "NO VERIFIABLE FACTUAL CLAIMS" or not claim.strip():
-            return ValidityVerdict(
-                is_relevant=False,
-                validity_score=1,
-                reasoning=f"This argument contains no verifiable factual claims related to the debate topic: '{debate_question}'. It consists only of opinions, rhetoric, or emotional statements that cannot be fact-checked.",
-                key_urls=[],
-                source_count=0
-            )
-        
-        # Step 2: Search for evidence
-        all_search_results = search_for_evidence(claim)
-        
-        # Filter for high-quality sources only (score > 0.5)
-        filtered_results = [
-            r for r in all_search_results 
-            if r.get('score', 0) > 0.5
-        ]
-        
-        # Sort by score (highest first) and take top 3
-        filtered_results.sort(key=lambda x: x.get('score', 0), reverse=True)
-        top_sources = filtered_results[:3]
-        
-        # If no sources pass the threshold, return low validity score (but still relevant if it has claims)
-        if not top_sources:
-            return ValidityVerdict(
-                is_relevant=True,  # Still relevant, just can't verify
-                validity_score=1,
-                reasoning="No high-quality sources found (all sources had relevance score ≤ 0.5). The claim cannot be verified with credible evidence.",
-                key_urls=[],
-                source_count=len(all_search_results)
-            )
-        
-        # Step 3: Analyze and score using only filtered high-quality sources
-        verdict = analyze_and_score(claim, top_sources, debate_question)
-        
-        # Extract URLs from top sources for key_urls (only high-quality sources with score > 0.5)
-        key_urls = [source.get('url', '') for source in top_sources if source.get('url')]
-        verdict.key_urls = key_urls[:3]  # Ensure max 3 URLs
-        
-        # Update source_count to reflect total sources found (before filtering)
-        verdict.source_count = len(all_search_results)
-        
-        return verdict
-        
+        verdict = await _run_pipeline_async(title, content, debate_question)
     except Exception as e:
-        # Return a default verdict on error
-        return ValidityVerdict(
-            is_relevant=True,  # Default to relevant on error
-            validity_score=1,
-            reasoning=f"Fact-checking failed: {str(e)}",
-            key_urls=[],
-            source_count=0
-        )
+        # Return a default verdict on error (not cached, so it is retried next time)
+        return _failed_verdict(str(e))
+    _cache_verdict(cache_key, verdict)
+    return verdict
+
+
+async def verify_arguments_iter(items: List[Dict], max_concurrency: int = MAX_CONCURRENT_CHECKS) -> AsyncIterator[Tuple[int, ValidityVerdict]]:
+    """
+    Fact-check many arguments concurrently, yielding each verdict as soon as it is ready.
+    
+    The three steps of each pipeline still run in order, but the pipelines overlap,
+    at most max_concurrency at a time. Closing the generator early cancels the checks
+    that haven't finished.
+    
+    Args:
+        items: Dictionaries with 'id', 'title', 'content' and 'debate_question'
+        max_concurrency: Maximum number of arguments checked at once
+    
+    Yields:
+        (argument id, ValidityVerdict) tuples in completion order
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+    
+    async def verify(item: Dict) -> Tuple[int, ValidityVerdict]:
+        async with semaphore:
+            return item['id'], await verify_argument_async(item['title'], item['content'], item['debate_question'])
+    
+    tasks = [asyncio.create_task(verify(item)) for item in items]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+async def verify_arguments_async(items: List[Dict], max_concurrency: int = MAX_CONCURRENT_CHECKS) -> Dict[int, ValidityVerdict]:
+    """
+    Fact-check many arguments concurrently with verify_argument_async.
+    
+    Args:
+        items: Dictionaries with 'id', 'title', 'content' and 'debate_question'
+        max_concurrency: Maximum number of arguments checked at once
+    
+    Returns:
+        Mapping of argument id to ValidityVerdict
+    """
+    return {
+        argument_id: verdict
+        async for argument_id, verdict in verify_arguments_iter(items, max_concurrency)
+    }
+
 
+async def aclose():
+    """Close the pooled Tavily clients. Called on application shutdown."""
+    tavily_http.close()
+    await tavily_async_http.aclose()
@@ -0,0 +1,149 @@
+import os
+import time
+import sqlite3
+import threading
+import hashlib
+import logging
+from collections import OrderedDict
+from typing import Optional, Protocol
+import orjson
+
+logger = logging.getLogger(__name__)
+
+# Default time-to-live for cached responses (1 day)
+DEFAULT_TTL = 86400
+
+
+class CacheBackend(Protocol):
+    """Minimal key/value interface used by the LLM response cache."""
+
+    def get(self, key: str) -> Optional[str]:
+        ...
+
+    def set(self, key: str, value: str, ttl: int = DEFAULT_TTL) -> None:
+        ...
+
+
+class InMemoryBackend:
+    """Process-local LRU cache with per-entry expiry. Used in development."""
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[str]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: str, ttl: int = DEFAULT_TTL) -> None:
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+class RedisBackend:
+    """Redis-backed cache shared between workers. Used when REDIS_URL is set."""
+
+    def __init__(self, url: str):
+        import redis
+        self._redis = redis.Redis.from_url(url)
+
+    def get(self, key: str) -> Optional[str]:
+        value = self._redis.get(key)
+        return value.decode('utf-8') if value is not None else None
+
+    def set(self, key: str, value: str, ttl: int = DEFAULT_TTL) -> None:
+        self._redis.set(key, value, ex=ttl)
+
+
+class SqliteBackend:
+    """On-disk cache that survives restarts without a Redis server. Used when LLM_CACHE_PATH is set."""
+
+    def __init__(self, path: str):
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS llm_cache (key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+        )
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM llm_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            value, expires_at = row
+            if expires_at < time.time():
+                self._conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                return None
+            return value
+
+    def set(self, key: str, value: str, ttl: int = DEFAULT_TTL) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, value, time.time() + ttl)
+            )
+
+
+class ResponseCache:
+    """Cache of Claude responses keyed by a hash of (model, prompt)."""
+
+    def __init__(self, backend: CacheBackend):
+        self.backend = backend
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(model: str, prompt: str) -> str:
+        payload = orjson.dumps({"model": model, "prompt": prompt}, option=orjson.OPT_SORT_KEYS)
+        return hashlib.sha256(payload).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        try:
+            value = self.backend.get(key)
+        except Exception as e:
+            # A broken cache must never break the request path
+            logger.warning(f"LLM cache read failed: {e}")
+            value = None
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def set(self, key: str, value: str, ttl: int = DEFAULT_TTL) -> None:
+        try:
+            self.backend.set(key, value, ttl=ttl)
+        except Exception as e:
+            logger.warning(f"LLM cache write failed: {e}")
+
+
+def _make_backend() -> CacheBackend:
+    """Use Redis when REDIS_URL is configured, else SQLite at LLM_CACHE_PATH, otherwise an in-process cache."""
+    redis_url = os.getenv("REDIS_URL")
+    if redis_url:
+        try:
+            return RedisBackend(redis_url)
+        except ImportError:
+            logger.warning("REDIS_URL is set but the redis package is not installed; using in-memory LLM cache")
+    cache_path = os.getenv("LLM_CACHE_PATH")
+    if cache_path:
+        try:
+            return SqliteBackend(cache_path)
+        except sqlite3.Error as e:
+            logger.warning(f"Could not open LLM cache at {cache_path} ({e}); using in-memory LLM cache")
+    return InMemoryBackend()
+
+
+response_cache = ResponseCache(_make_backend())
@@ -3,28 +3,39 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError
 import database
+import database_async
+import anthropic_client
+import fact_checker
 from routes import topics, arguments, summaries, fact_checking, voting
 import logging
 import traceback
+import asyncio
 import os
 
 # Configure logging
 logging.basicConfig(
-    level=logging.INFO,
+    level=os.getenv("LOG_LEVEL", "INFO").upper(),
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 logger = logging.getLogger(__name__)
 
-# Initialize database
-database.init_db()
-# Run migration to add validity columns
-database.migrate_add_validity_columns()
-# Run migration to add votes column
-database.migrate_add_votes_column()
-
 # Create FastAPI app
 app = FastAPI(title="Debately API", version="1.0.0")
 
+@app.on_event("startup")
+async def prepare_database():
+    """Create/migrate the schema (tables + migrations in one transaction), then open the asyncpg pool used by the hot read paths."""
+    await asyncio.to_thread(database.ensure_schema)
+    await database_async.init_pool()
+
+@app.on_event("shutdown")
+async def close_pooled_connections():
+    """Release the pooled Claude, Tavily and database connections."""
+    await anthropic_client.aclose()
+    await fact_checker.aclose()
+    await database_async.close_pool()
+    database.close_pool()
+
 # Add exception handler for validation errors
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
@@ -64,22 +75,27 @@ async def general_exception_handler(request: Request, exc: Exception):
         content={"detail": f"Internal server error: {str(exc)}"}
     )
 
+# Largest request body the logging middleware will read (bytes)
+MAX_LOGGED_BODY_BYTES = 64 * 1024
+
 # Add logging middleware
 @app.middleware("http")
 async def log_requests(request: Request, call_next):
     """Log all requests and responses."""
     logger.info(f"{request.method} {request.url.path}")
     
-    # Read and log request body for POST/PUT/PATCH
-    if request.method in ["POST", "PUT", "PATCH"]:
+    # Log small JSON request bodies only when debugging; otherwise the body is left
+    # for the handler to read once
+    if (
+        request.method in ["POST", "PUT", "PATCH"]
+        and logger.isEnabledFor(logging.DEBUG)
+        and "application/json" in request.headers.get("content-type", "")
+        and request.headers.get("content-length", "").isdigit()
+        and int(request.headers["content-length"]) <= MAX_LOGGED_BODY_BYTES
+    ):
         body = await request.body()
         if body:
-            try:
-                import json
-                body_json = json.loads(body)
-                logger.info(f"Request body: {json.dumps(body_json, indent=2)}")
-            except:
-                logger.info(f"Request body (raw): {body.decode('utf-8', errors='ignore')}")
+            logger.debug(f"Request body: {body[:2048].decode('utf-8', errors='ignore')}")
         
         # Recreate request with body for downstream handlers
         async def receive():
@@ -121,8 +137,8 @@ async def health_check():
     """Health check endpoint for monitoring and load balancers."""
     try:
         # Check database connection
-        conn = database.get_db_connection()
-        conn.close()
+        with database.db_cursor() as (conn, cursor):
+            cursor.execute("SELECT 1")
         return {"status": "healthy", "database": "connected"}
     except Exception as e:
         logger.error(f"Health check failed: {e}")
@@ -91,6 +91,14 @@ class ValidityVerdictResponse(BaseModel):
     key_urls: List[str]
     source_count: int
 
+class FactCheckItem(BaseModel):
+    title: str = Field(..., description="Title of the argument")
+    content: str = Field(..., description="Content of the argument")
+
+class FactCheckBatchRequest(BaseModel):
+    debate_question: str = Field(..., description="The debate question the arguments respond to")
+    arguments: List[FactCheckItem] = Field(..., min_length=1, max_length=50, description="Arguments to fact-check (at most 50)")
+
 class ArgumentWithValidityResponse(ArgumentResponse):
     validity_score: Optional[int] = None
     validity_reasoning: Optional[str] = None
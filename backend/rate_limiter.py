@@ -0,0 +1,41 @@
+import time
+import asyncio
+
+
+class AsyncRateLimiter:
+    """
+    Token bucket allowing limit_per_minute units per minute (requests, or tokens when
+    acquire is given an amount), with bursts of up to a minute's worth.
+
+    Waiters are served in arrival order. record() charges units after the fact, e.g.
+    the difference between an estimated and the actual token count of a request.
+    """
+
+    def __init__(self, limit_per_minute: float):
+        self.capacity = float(limit_per_minute)
+        self._rate = self.capacity / 60.0
+        self._available = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._available = min(self.capacity, self._available + (now - self._updated) * self._rate)
+        self._updated = now
+
+    async def acquire(self, amount: float = 1.0):
+        """Wait until amount units are available and take them."""
+        # A single request larger than the whole bucket waits for a full bucket
+        amount = min(amount, self.capacity)
+        async with self._lock:
+            while True:
+                self._refill()
+                if self._available >= amount:
+                    self._available -= amount
+                    return
+                await asyncio.sleep((amount - self._available) / self._rate)
+
+    def record(self, amount: float):
+        """Charge (or refund, if negative) units without waiting."""
+        self._refill()
+        self._available = min(self.capacity, self._available - amount)
@@ -1,6 +1,7 @@
 from fastapi import APIRouter, HTTPException, Query
 from typing import Optional
 import database
+import database_async
 import fact_checker
 from models import ArgumentCreate, ArgumentCreateResponse, ArgumentResponse
 import logging
@@ -16,7 +17,7 @@ async def create_argument(topic_id: int, argument: ArgumentCreate):
     logger.info(f"Argument data: title={argument.title[:50]}..., author={argument.author}")
     
     # Validate topic exists
-    topic = database.get_topic(topic_id)
+    topic = await database_async.get_topic(topic_id)
     if not topic:
         logger.error(f"Topic {topic_id} not found")
         raise HTTPException(status_code=404, detail=f"Topic with id {topic_id} not found")
@@ -34,7 +35,7 @@ async def create_argument(topic_id: int, argument: ArgumentCreate):
     
     try:
         # Run fact-checker to verify relevance before saving
-        verdict = fact_checker.verify_argument(
+        verdict = await fact_checker.verify_argument_async(
             title=argument.title,
             content=argument.content,
             debate_question=topic['question']
@@ -107,7 +108,7 @@ async def get_arguments(
 ):
     """Get arguments for a topic, optionally filtered by side."""
     # Validate topic exists
-    topic = database.get_topic(topic_id)
+    topic = await database_async.get_topic(topic_id)
     if not topic:
         raise HTTPException(status_code=404, detail=f"Topic with id {topic_id} not found")
     
@@ -117,7 +118,7 @@ async def get_arguments(
     
     try:
         filter_side = None if (side is None or side == 'both') else side
-        arguments = database.get_arguments(topic_id, filter_side)
+        arguments = await database_async.get_arguments(topic_id, filter_side)
         return [ArgumentResponse(**arg) for arg in arguments]
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to fetch arguments: {str(e)}")
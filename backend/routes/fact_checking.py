@@ -1,11 +1,21 @@
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 from typing import Optional
+import orjson
+import logging
 import database
+import database_async
 import fact_checker
-from models import ValidityVerdictResponse, ArgumentWithValidityResponse
+from models import ValidityVerdictResponse, ArgumentWithValidityResponse, FactCheckBatchRequest
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api", tags=["fact-checking"])
 
+def _sse(event: str, data) -> str:
+    """Format one server-sent event."""
+    return f"event: {event}\ndata: {orjson.dumps(data).decode()}\n\n"
+
 @router.post("/arguments/{argument_id}/verify", response_model=ValidityVerdictResponse)
 async def verify_argument(argument_id: int):
     """
@@ -13,18 +23,18 @@ async def verify_argument(argument_id: int):
     Runs the fact-checking pipeline and saves results to database.
     """
     # Get argument from database
-    argument = database.get_argument(argument_id)
+    argument = await database_async.get_argument(argument_id)
     if not argument:
         raise HTTPException(status_code=404, detail=f"Argument with id {argument_id} not found")
     
     # Get the topic/question for context
-    topic = database.get_topic(argument['topic_id'])
+    topic = await database_async.get_topic(argument['topic_id'])
     if not topic:
         raise HTTPException(status_code=404, detail=f"Topic for argument {argument_id} not found")
     
     try:
-        # Run fact-checking pipeline with debate question context
-        verdict = fact_checker.verify_argument(
+        # Run fact-checking pipeline with debate question context (without blocking the event loop)
+        verdict = await fact_checker.verify_argument_async(
             title=argument['title'],
             content=argument['content'],
             debate_question=topic['question']
@@ -72,14 +82,20 @@ async def verify_all_arguments(topic_id: int):
         "results": []
     }
     
+    # All pipelines run concurrently (bounded by fact_checker.MAX_CONCURRENT_CHECKS)
+    verdicts = await fact_checker.verify_arguments_async([
+        {
+            'id': arg['id'],
+            'title': arg['title'],
+            'content': arg['content'],
+            'debate_question': topic['question']
+        }
+        for arg in arguments
+    ])
+    
     for arg in arguments:
+        verdict = verdicts[arg['id']]
         try:
-            verdict = fact_checker.verify_argument(
-                title=arg['title'],
-                content=arg['content'],
-                debate_question=topic['question']
-            )
-            
             # Save results to database
             database.update_argument_validity(
                 argument_id=arg['id'],
@@ -108,6 +124,88 @@ async def verify_all_arguments(topic_id: int):
     return results
 
 
+@router.post("/fact-check/batch", response_model=list[ValidityVerdictResponse])
+async def fact_check_batch(request: FactCheckBatchRequest):
+    """
+    Fact-check up to 50 arguments against a debate question without saving anything.
+    The pipelines run concurrently; verdicts are returned in request order.
+    """
+    try:
+        verdicts = await fact_checker.verify_arguments_async([
+            {
+                'id': index,
+                'title': item.title,
+                'content': item.content,
+                'debate_question': request.debate_question
+            }
+            for index, item in enumerate(request.arguments)
+        ])
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to fact-check arguments: {str(e)}")
+    
+    return [
+        ValidityVerdictResponse(
+            validity_score=verdicts[index].validity_score,
+            reasoning=verdicts[index].reasoning,
+            key_urls=verdicts[index].key_urls,
+            source_count=verdicts[index].source_count
+        )
+        for index in range(len(request.arguments))
+    ]
+
+
+@router.post("/topics/{topic_id}/verify-all/stream")
+async def stream_verify_all_arguments(topic_id: int):
+    """
+    Verify all arguments for a topic concurrently, streamed as server-sent events.
+    Emits one "verdict" event per argument as soon as its check finishes (and is saved),
+    then a final "done" event with the number of arguments verified.
+    """
+    # Validate topic exists
+    topic = database.get_topic(topic_id)
+    if not topic:
+        raise HTTPException(status_code=404, detail=f"Topic with id {topic_id} not found")
+    
+    arguments = database.get_arguments(topic_id)
+    if not arguments:
+        raise HTTPException(status_code=400, detail="Topic has no arguments to verify")
+    
+    async def events():
+        verified = 0
+        try:
+            async for argument_id, verdict in fact_checker.verify_arguments_iter([
+                {
+                    'id': arg['id'],
+                    'title': arg['title'],
+                    'content': arg['content'],
+                    'debate_question': topic['question']
+                }
+                for arg in arguments
+            ]):
+                database.update_argument_validity(
+                    argument_id=argument_id,
+                    validity_score=verdict.validity_score,
+                    validity_reasoning=verdict.reasoning,
+                    key_urls=verdict.key_urls
+                )
+                verified += 1
+                yield _sse("verdict", {
+                    "argument_id": argument_id,
+                    **ValidityVerdictResponse(
+                        validity_score=verdict.validity_score,
+                        reasoning=verdict.reasoning,
+                        key_urls=verdict.key_urls,
+                        source_count=verdict.source_count
+                    ).model_dump()
+                })
+            yield _sse("done", {"total_arguments": len(arguments), "verified": verified})
+        except Exception as e:
+            logger.error(f"Verification stream failed for topic {topic_id}: {e}", exc_info=True)
+            yield _sse("error", {"detail": str(e)})
+    
+    return StreamingResponse(events(), media_type="text/event-stream")
+
+
 @router.get("/topics/{topic_id}/arguments/verified", response_model=list[ArgumentWithValidityResponse])
 async def get_arguments_sorted_by_validity(
     topic_id: int,
@@ -1,46 +1,67 @@
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
+import orjson
+import logging
 import database
 import claude_service
 from models import SummaryResponse
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(prefix="/api/topics/{topic_id}", tags=["summaries"])
 
-@router.post("/generate-summary", response_model=SummaryResponse)
-async def generate_summary(topic_id: int):
-    """Generate summary, consensus view, and timeline view using Claude."""
+def _get_topic_for_summary(topic_id: int) -> dict:
+    """Load a topic and check it has arguments on both sides."""
     # Validate topic exists
     topic_data = database.get_topic_with_arguments(topic_id)
     if not topic_data:
         raise HTTPException(status_code=404, detail=f"Topic with id {topic_id} not found")
     
-    # Get arguments
-    pro_arguments = topic_data['pro_arguments']
-    con_arguments = topic_data['con_arguments']
-    
-    if not pro_arguments or not con_arguments:
+    if not topic_data['pro_arguments'] or not topic_data['con_arguments']:
         raise HTTPException(
             status_code=400,
             detail="Topic must have at least one pro argument and one con argument to generate summary"
         )
+    return topic_data
+
+def _save_analysis(topic_id: int, result: dict):
+    """Persist generated analysis and argument matches."""
+    database.update_topic_analysis(
+        topic_id=topic_id,
+        overall_summary=result['overall_summary'],
+        consensus_view=result['consensus_view'],
+        timeline_view=result['timeline_view']
+    )
+    database.save_argument_matches(topic_id, result['pairs'])
+
+def _sse(event: str, data) -> str:
+    """Format one server-sent event."""
+    return f"event: {event}\ndata: {orjson.dumps(data).decode()}\n\n"
+
+@router.post("/generate-summary", response_model=SummaryResponse)
+async def generate_summary(topic_id: int):
+    """Generate summary, consensus view, timeline view and argument matches using Claude."""
+    topic_data = _get_topic_for_summary(topic_id)
+    pro_arguments = topic_data['pro_arguments']
+    con_arguments = topic_data['con_arguments']
     
     try:
-        # Call Claude service
-        result = claude_service.generate_summary(
+        # Call Claude service (analysis and argument matches come back from one call)
+        result = await claude_service.generate_summary_and_pairs(
             question=topic_data['question'],
             pro_arguments=pro_arguments,
             con_arguments=con_arguments
         )
         
         # Update database
-        database.update_topic_analysis(
-            topic_id=topic_id,
+        _save_analysis(topic_id, result)
+        
+        return SummaryResponse(
             overall_summary=result['overall_summary'],
             consensus_view=result['consensus_view'],
             timeline_view=result['timeline_view']
         )
         
-        return SummaryResponse(**result)
-        
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except RuntimeError as e:
@@ -48,4 +69,33 @@ async def generate_summary(topic_id: int):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to generate summary: {str(e)}")
 
-
+@router.post("/generate-summary/stream")
+async def stream_summary(topic_id: int):
+    """
+    Generate the same analysis as /generate-summary, streamed as server-sent events.
+    Emits overall_summary and consensus_view as soon as each is complete, one event per
+    timeline_view / pairs element, then a final "done" event with the full summary.
+    """
+    topic_data = _get_topic_for_summary(topic_id)
+    
+    async def events():
+        try:
+            async for key, value in claude_service.stream_summary_and_pairs(
+                question=topic_data['question'],
+                pro_arguments=topic_data['pro_arguments'],
+                con_arguments=topic_data['con_arguments']
+            ):
+                if key == 'result':
+                    _save_analysis(topic_id, value)
+                    yield _sse("done", SummaryResponse(
+                        overall_summary=value['overall_summary'],
+                        consensus_view=value['consensus_view'],
+                        timeline_view=value['timeline_view']
+                    ).model_dump())
+                else:
+                    yield _sse(key, value)
+        except Exception as e:
+            logger.error(f"Summary stream failed for topic {topic_id}: {e}", exc_info=True)
+            yield _sse("error", {"detail": str(e)})
+    
+    return StreamingResponse(events(), media_type="text/event-stream")
@@ -1,5 +1,8 @@
+import asyncio
+from typing import Optional
 from fastapi import APIRouter, HTTPException
 import database
+import database_async
 import fact_checker
 import claude_service
 from models import TopicCreate, TopicResponse, TopicListItem, TopicDetailResponse
@@ -32,83 +35,106 @@ async def create_topic(topic: TopicCreate):
 async def get_topics():
     """Get all topics with pro/con argument counts."""
     try:
-        topics = database.get_all_topics()
+        topics = await database_async.get_all_topics()
         return [TopicListItem(**topic) for topic in topics]
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to fetch topics: {str(e)}")
 
+async def _verify_missing_arguments(topic_data: dict) -> bool:
+    """
+    Fact-check every argument without a validity score concurrently.
+    Updates the arguments in topic_data in place. Returns True if any were checked.
+    """
+    unchecked = [
+        arg for arg in topic_data['pro_arguments'] + topic_data['con_arguments']
+        if arg.get('validity_score') is None
+    ]
+    if not unchecked:
+        return False
+    
+    verdicts = await fact_checker.verify_arguments_async([
+        {
+            'id': arg['id'],
+            'title': arg['title'],
+            'content': arg['content'],
+            'debate_question': topic_data['question']
+        }
+        for arg in unchecked
+    ])
+    for arg in unchecked:
+        verdict = verdicts[arg['id']]
+        updated = database.update_argument_validity(
+            argument_id=arg['id'],
+            validity_score=verdict.validity_score,
+            validity_reasoning=verdict.reasoning,
+            key_urls=verdict.key_urls
+        )
+        if updated:
+            arg.update(updated)
+    return True
+
+def _sort_by_validity(arguments: list) -> list:
+    """Order arguments like the detail query: highest validity first, unverified last, newest first on ties."""
+    arguments = sorted(arguments, key=lambda arg: arg['created_at'], reverse=True)
+    arguments.sort(key=lambda arg: (arg['validity_score'] is None, -(arg['validity_score'] or 0)))
+    return arguments
+
+async def _generate_missing_analysis(topic_id: int, topic_data: dict) -> Optional[dict]:
+    """Generate and save Claude analysis if the topic has none. Returns the new analysis, if any."""
+    needs_analysis = (
+        not topic_data.get('overall_summary') or
+        not topic_data.get('consensus_view') or
+        not topic_data.get('timeline_view')
+    )
+    pro_args = topic_data['pro_arguments']
+    con_args = topic_data['con_arguments']
+    if not needs_analysis or not pro_args or not con_args:
+        return None
+    
+    try:
+        result = await claude_service.generate_summary_and_pairs(
+            question=topic_data['question'],
+            pro_arguments=pro_args,
+            con_arguments=con_args
+        )
+        database.update_topic_analysis(
+            topic_id=topic_id,
+            overall_summary=result['overall_summary'],
+            consensus_view=result['consensus_view'],
+            timeline_view=result['timeline_view']
+        )
+        database.save_argument_matches(topic_id, result['pairs'])
+        return result
+    except Exception:
+        # Continue even if analysis generation fails
+        return None
+
 @router.get("/{topic_id}", response_model=TopicDetailResponse)
 async def get_topic(topic_id: int):
     """
     Get a topic with its arguments and analysis.
     Automatically verifies arguments and generates Claude analysis if missing.
+    Verification and analysis are independent, so they run concurrently.
     Arguments are always sorted by validity score (highest first).
     """
-    topic_data = database.get_topic_with_arguments(topic_id)
+    topic_data = await database_async.get_topic_with_arguments(topic_id)
     if not topic_data:
         raise HTTPException(status_code=404, detail=f"Topic with id {topic_id} not found")
     
-    # Check if any arguments need verification
-    all_arguments = topic_data['pro_arguments'] + topic_data['con_arguments']
-    needs_verification = any(
-        arg.get('validity_score') is None for arg in all_arguments
+    verified, analysis = await asyncio.gather(
+        _verify_missing_arguments(topic_data),
+        _generate_missing_analysis(topic_id, topic_data)
     )
     
-    # Auto-verify all arguments if needed
-    if needs_verification and all_arguments:
-        for arg in all_arguments:
-            if arg.get('validity_score') is None:
-                try:
-                    verdict = fact_checker.verify_argument(
-                        title=arg['title'],
-                        content=arg['content'],
-                        debate_question=topic_data['question']
-                    )
-                    database.update_argument_validity(
-                        argument_id=arg['id'],
-                        validity_score=verdict.validity_score,
-                        validity_reasoning=verdict.reasoning,
-                        key_urls=verdict.key_urls
-                    )
-                except Exception:
-                    # Continue even if verification fails for one argument
-                    pass
-        
-        # Refetch topic data with updated validity scores
-        topic_data = database.get_topic_with_arguments(topic_id)
-    
-    # Check if Claude analysis is missing
-    needs_analysis = (
-        not topic_data.get('overall_summary') or
-        not topic_data.get('consensus_view') or
-        not topic_data.get('timeline_view')
-    )
+    if verified:
+        # The updated rows came back from the UPDATEs; only the ordering needs redoing
+        topic_data['pro_arguments'] = _sort_by_validity(topic_data['pro_arguments'])
+        topic_data['con_arguments'] = _sort_by_validity(topic_data['con_arguments'])
     
-    # Auto-generate Claude analysis if needed
-    if needs_analysis:
-        pro_args = topic_data['pro_arguments']
-        con_args = topic_data['con_arguments']
-        
-        if pro_args and con_args:
-            try:
-                result = claude_service.generate_summary(
-                    question=topic_data['question'],
-                    pro_arguments=pro_args,
-                    con_arguments=con_args
-                )
-                database.update_topic_analysis(
-                    topic_id=topic_id,
-                    overall_summary=result['overall_summary'],
-                    consensus_view=result['consensus_view'],
-                    timeline_view=result['timeline_view']
-                )
-                # Update topic_data with new analysis
-                topic_data['overall_summary'] = result['overall_summary']
-                topic_data['consensus_view'] = result['consensus_view']
-                topic_data['timeline_view'] = result['timeline_view']
-            except Exception:
-                # Continue even if analysis generation fails
-                pass
+    if analysis:
+        # Update topic_data with new analysis
+        topic_data['overall_summary'] = analysis['overall_summary']
+        topic_data['consensus_view'] = analysis['consensus_view']
+        topic_data['timeline_view'] = analysis['timeline_view']
     
     return TopicDetailResponse(**topic_data)
-
@@ -1,5 +1,6 @@
 from fastapi import APIRouter, HTTPException
 import database
+import database_async
 from models import CommentCreate, CommentCreateResponse, CommentResponse
 import logging
 
@@ -11,12 +12,11 @@ router = APIRouter(prefix="/api/arguments", tags=["voting"])
 async def upvote_argument(argument_id: int):
     """Upvote an argument. Increments vote count by 1."""
     # Validate argument exists
-    argument = database.get_argument(argument_id)
-    if not argument:
+    if not await database_async.argument_exists(argument_id):
         raise HTTPException(status_code=404, detail=f"Argument with id {argument_id} not found")
     
     try:
-        votes = database.upvote_argument(argument_id)
+        votes = await database_async.upvote_argument(argument_id)
         return {"argument_id": argument_id, "votes": votes}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to upvote argument: {str(e)}")
@@ -25,12 +25,11 @@ async def upvote_argument(argument_id: int):
 async def downvote_argument(argument_id: int):
     """Downvote an argument. Decrements vote count by 1."""
     # Validate argument exists
-    argument = database.get_argument(argument_id)
-    if not argument:
+    if not await database_async.argument_exists(argument_id):
         raise HTTPException(status_code=404, detail=f"Argument with id {argument_id} not found")
     
     try:
-        votes = database.downvote_argument(argument_id)
+        votes = await database_async.downvote_argument(argument_id)
         return {"argument_id": argument_id, "votes": votes}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to downvote argument: {str(e)}")
@@ -41,8 +40,7 @@ async def get_comments(argument_id: int):
     logger.info(f"Fetching comments for argument {argument_id}")
     
     # Validate argument exists
-    argument = database.get_argument(argument_id)
-    if not argument:
+    if not database.argument_exists(argument_id):
         logger.error(f"Argument {argument_id} not found")
         raise HTTPException(status_code=404, detail=f"Argument with id {argument_id} not found")
 
@@ -63,8 +61,7 @@ async def comment_on_argument(argument_id: int, comment: CommentCreate):
     logger.info(f"Creating comment for argument {argument_id}")
     
     # Validate argument exists
-    argument = database.get_argument(argument_id)
-    if not argument:
+    if not database.argument_exists(argument_id):
         logger.error(f"Argument {argument_id} not found")
         raise HTTPException(status_code=404, detail=f"Argument with id {argument_id} not found")
 
@@ -0,0 +1,10 @@
+import os
+import sys
+from pathlib import Path
+
+# The backend modules are imported by name, as uvicorn does from the backend directory
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+# fact_checker refuses to import without API keys; the unit tests never call the APIs
+os.environ.setdefault("ANTHROPIC_API_KEY", "test")
+os.environ.setdefault("TAVILY_API_KEY", "test")
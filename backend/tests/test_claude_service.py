@@ -0,0 +1,60 @@
+import json
+
+import claude_service
+
+
+def _feed_in_chunks(text, size):
+    parser = claude_service._IncrementalJSONFields()
+    events = []
+    for i in range(0, len(text), size):
+        events.extend(parser.feed(text[i:i + size]))
+    return events
+
+
+SUMMARY = {
+    "overall_summary": "Both sides cite \"data\" {and} [brackets]",
+    "consensus_view": "Line one\nline two \\ with a backslash",
+    "timeline_view": [{"period": "2020", "description": "a, b"}, {"period": "2021", "description": "c"}],
+    "pairs": [{"pro_id": 1, "con_id": 2, "reason": "direct rebuttal"}],
+    "score": 12345
+}
+
+
+def test_incremental_fields_match_a_full_parse_for_any_chunking():
+    text = json.dumps(SUMMARY)
+    expected = [
+        ("overall_summary", SUMMARY["overall_summary"]),
+        ("consensus_view", SUMMARY["consensus_view"]),
+        *[("timeline_view", item) for item in SUMMARY["timeline_view"]],
+        *[("pairs", item) for item in SUMMARY["pairs"]],
+        ("score", 12345),
+    ]
+    for size in (1, 2, 3, 7, 64, len(text)):
+        assert _feed_in_chunks(text, size) == expected
+
+
+def test_incremental_fields_hold_back_unfinished_values():
+    parser = claude_service._IncrementalJSONFields()
+    assert parser.feed('Here you go: {"overall_summary": "half a sent') == []
+    assert parser.feed('ence", "score": 12') == [("overall_summary", "half a sentence")]
+    # The number could still grow until something follows it
+    assert parser.feed('3') == []
+    assert parser.feed('}') == [("score", 123)]
+
+
+def test_incremental_fields_stop_at_a_truncated_stream():
+    text = json.dumps(SUMMARY)
+    truncated = text[:text.index('"pairs"') + 20]
+    events = _feed_in_chunks(truncated, 5)
+    assert [key for key, _ in events] == ["overall_summary", "consensus_view", "timeline_view", "timeline_view"]
+
+
+def test_extract_json_skips_fences_and_braces_inside_strings():
+    payload = {"overall_summary": "a } b ] c \" d", "pairs": []}
+    text = "```json\n" + json.dumps(payload) + "\n```\nTrailing {note}"
+    assert json.loads(claude_service._extract_json(text)) == payload
+
+
+def test_extract_json_returns_the_rest_of_an_unclosed_object():
+    assert claude_service._extract_json('prefix {"a": "b') == '{"a": "b'
+    assert claude_service._extract_json("no json here") == "no json here"
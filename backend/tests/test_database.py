@@ -0,0 +1,34 @@
+import psycopg2
+import pytest
+
+import database
+
+
+@pytest.fixture(scope="module")
+def topic_id():
+    """A topic with one pro and one con argument in the configured database."""
+    try:
+        database.ensure_schema()
+    except psycopg2.OperationalError as e:
+        pytest.skip(f"PostgreSQL is not reachable: {e}")
+
+    topic = database.create_topic(question="Test topic for validity sort", created_by="tests")
+    database.create_argument(topic['id'], side='pro', title="Pro", content="Pro content", sources=None, author="tests")
+    database.create_argument(topic['id'], side='con', title="Con", content="Con content", sources=None, author="tests")
+    yield topic['id']
+
+    with database.db_cursor() as (conn, cursor):
+        cursor.execute("DELETE FROM arguments WHERE topic_id = %s", (topic['id'],))
+        cursor.execute("DELETE FROM topics WHERE id = %s", (topic['id'],))
+    database.close_pool()
+
+
+def test_sorted_by_validity_releases_its_connection(topic_id):
+    # The server-side cursor must be closed before the commit; closing it afterwards
+    # raised and leaked the pooled connection on every call
+    for _ in range(2):
+        arguments = database.get_arguments_sorted_by_validity(topic_id)
+        assert {arg['side'] for arg in arguments} == {'pro', 'con'}
+
+    assert database.get_arguments_sorted_by_validity(topic_id, 'pro')[0]['title'] == "Pro"
+    assert not database._get_pool()._used
@@ -0,0 +1,60 @@
+import fact_checker
+
+
+def test_prefilter_skips_only_opinion_in_title_and_content():
+    assert fact_checker._is_likely_non_factual("this sucks", "lol this is so stupid")
+
+
+def test_prefilter_keeps_claims_with_ambiguous_words():
+    assert not fact_checker._is_likely_non_factual(
+        "Climate change is not real", "Climate change is not real, scientists are wrong"
+    )
+    assert not fact_checker._is_likely_non_factual("Teens love it", "everyone i know would agree")
+
+
+def test_prefilter_needs_the_title_to_fail_too():
+    assert not fact_checker._is_likely_non_factual("Emissions doubled since 1990", "this is stupid")
+
+
+def test_source_budget_handles_whitespace_content_and_negative_budget():
+    assert fact_checker._source_content_chars([{'content': '   ', 'score': 0.9}], -10) == [0]
+
+
+def test_source_budget_keeps_the_minimum_and_caps_each_source():
+    results = [{'content': 'word ' * 5000}, {'content': 'short text'}]
+    chars = fact_checker._source_content_chars(results, 100000)
+    assert chars == [fact_checker.MAX_SOURCE_CONTENT_CHARS, len('short text')]
+    assert fact_checker._source_content_chars(results, 0)[0] == fact_checker.MIN_SOURCE_CONTENT_CHARS
+
+
+def test_empty_source_shows_the_no_content_marker():
+    results = [{'title': 't', 'url': 'u', 'score': 0.9}]
+    formatted = fact_checker.format_tavily_results(results, fact_checker._source_content_chars(results, 10))
+    assert "Content: No content..." in formatted
+
+
+def test_parse_verdict_reads_json_inside_fences_and_prose():
+    text = 'Here is my verdict:\n```json\n{"is_relevant": true, "validity_score": 4, "reasoning": "Sources say \\"yes\\" {twice}", "key_urls": ["https://a", "https://b"]}\n```\nDone.'
+    verdict = fact_checker._parse_verdict(text, source_count=2)
+    assert (verdict.is_relevant, verdict.validity_score) == (True, 4)
+    assert verdict.reasoning == 'Sources say "yes" {twice}'
+    assert verdict.key_urls == ["https://a", "https://b"]
+    assert verdict.source_count == 2
+
+
+def test_parse_verdict_salvages_unescaped_quotes_in_reasoning():
+    text = '{"is_relevant": false, "validity_score": 1, "reasoning": "Calls it "fake news" without evidence", "key_urls": []}'
+    verdict = fact_checker._parse_verdict(text, source_count=0)
+    assert (verdict.is_relevant, verdict.validity_score) == (False, 1)
+    assert verdict.reasoning == 'Calls it "fake news" without evidence'
+
+
+def test_parse_verdict_falls_back_to_defaults_on_a_truncated_response():
+    verdict = fact_checker._parse_verdict('{"is_relevant": true, "validity_score": 5, "reasoning": "The evidence is cle', 3)
+    assert verdict.validity_score == 5
+    assert verdict.reasoning == "Unable to parse reasoning from response"
+    assert verdict.key_urls == []
+
+
+def test_parse_verdict_clamps_out_of_range_scores():
+    assert fact_checker._parse_verdict('{"validity_score": 9, "reasoning": "x"}', 1).validity_score == 3
@@ -0,0 +1,78 @@
+import asyncio
+
+from rate_limiter import AsyncRateLimiter
+
+
+class FakeClock:
+    """Stands in for time.monotonic and asyncio.sleep so refill timing is exact."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    async def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def _limiter(monkeypatch, limit_per_minute):
+    clock = FakeClock()
+    monkeypatch.setattr("rate_limiter.time.monotonic", clock.monotonic)
+    monkeypatch.setattr("rate_limiter.asyncio.sleep", clock.sleep)
+    return AsyncRateLimiter(limit_per_minute), clock
+
+
+def test_bursts_up_to_capacity_then_waits_for_refill(monkeypatch):
+    limiter, clock = _limiter(monkeypatch, 60)
+
+    async def run():
+        for _ in range(60):
+            await limiter.acquire()
+        assert clock.sleeps == []
+        await limiter.acquire()
+
+    asyncio.run(run())
+    # 60 per minute refills one unit per second
+    assert clock.sleeps == [1.0]
+
+
+def test_refill_is_capped_at_capacity(monkeypatch):
+    limiter, clock = _limiter(monkeypatch, 60)
+
+    async def run():
+        await limiter.acquire(60)
+        clock.now += 3600
+        await limiter.acquire(60)
+        await limiter.acquire(30)
+
+    asyncio.run(run())
+    assert clock.sleeps == [30.0]
+
+
+def test_record_charges_and_refunds_without_waiting(monkeypatch):
+    limiter, clock = _limiter(monkeypatch, 600)
+
+    async def run():
+        await limiter.acquire(100)
+        limiter.record(500)  # the request turned out larger than estimated
+        await limiter.acquire(10)
+        limiter.record(-1000)  # refunds never overfill the bucket
+        await limiter.acquire(600)
+
+    asyncio.run(run())
+    # 10 units at 10 per second after the bucket was drained to 0
+    assert clock.sleeps == [1.0]
+
+
+def test_oversized_requests_wait_for_a_full_bucket(monkeypatch):
+    limiter, clock = _limiter(monkeypatch, 60)
+
+    async def run():
+        await limiter.acquire(1)
+        await limiter.acquire(1000)
+
+    asyncio.run(run())
+    assert clock.sleeps == [1.0]